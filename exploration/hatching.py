@@ -1,6 +1,7 @@
 #  Copyright (c) 2022, Manfred Moitzi
 #  License: MIT License
 from pathlib import Path
+import functools
 import time
 
 import ezdxf
@@ -8,9 +9,14 @@ from ezdxf.math import Vec2, Matrix44
 from ezdxf.render import forms, hatching
 from ezdxf import path
 
-CWD = Path("~/Desktop/Outbox").expanduser()
-if not CWD.exists():
-    CWD = Path(".")
+
+@functools.lru_cache(maxsize=1)
+def cwd() -> Path:
+    # check the output folder at first usage and not at import
+    folder = Path("~/Desktop/Outbox").expanduser()
+    if not folder.exists():
+        folder = Path(".")
+    return folder
 
 
 def polygon_hatching(filename: str):
@@ -21,16 +27,21 @@ def polygon_hatching(filename: str):
         forms.gear(16, top_width=1, bottom_width=3, height=2, outside_radius=10)
     )
     hole = list(forms.circle(16, radius=4))
-    hole1 = Vec2.list(forms.translate(hole, (-2, -2)))
-    hole2 = Vec2.list(forms.translate(hole, (2, 2)))
+    hole1 = translate2d(hole, Vec2(-2, -2))
+    hole2 = translate2d(hole, Vec2(2, 2))
     baseline = hatching.HatchBaseLine(
         Vec2(), direction=Vec2(1, 1), offset=Vec2(-1, 1)
     )
     render_hatch(msp, baseline, polygon, [hole1, hole2])
-    doc.saveas(CWD / filename)
+    doc.saveas(cwd() / filename)
 
 
 SIZE = 0.1
+# The add_...() methods copy the dxfattribs, sharing these dicts is safe:
+POLYGON_ATTRIBS = {"layer": "POLYGON"}
+POINTS_ATTRIBS = {"layer": "POINTS"}
+HATCH_ATTRIBS = {"layer": "HATCH"}
+MARKERS_ATTRIBS = {"layer": "MARKERS"}
 
 
 def setup(doc):
@@ -43,31 +54,33 @@ def setup(doc):
     marker.add_line((-SIZE, SIZE), (SIZE, -SIZE))
 
 
+def translate2d(vertices, offset: Vec2) -> list[Vec2]:
+    # Converts the vertices only once into Vec2 objects, forms.translate()
+    # creates Vec3 objects which have to be converted to Vec2 objects again.
+    vertices = Vec2.list(vertices)
+    if offset.is_null:
+        return vertices
+    return [v + offset for v in vertices]
+
+
 def render_hatch(msp, baseline, polygon, holes=None, offset=Vec2()):
-    polygons = [Vec2.list(forms.translate(polygon, offset))]
+    polygons = [translate2d(polygon, offset)]
     if holes:
         for hole in holes:
-            polygons.append(Vec2.list(forms.translate(hole, offset)))
+            polygons.append(translate2d(hole, offset))
+    add_circle = msp.add_circle
+    add_line = msp.add_line
+    add_blockref = msp.add_blockref
     for polygon in polygons:
-        msp.add_lwpolyline(
-            polygon,
-            close=True,
-            dxfattribs={"layer": "POLYGON"},
-        )
+        msp.add_lwpolyline(polygon, close=True, dxfattribs=POLYGON_ATTRIBS)
         for p in polygon:
-            msp.add_circle(
-                p,
-                radius=SIZE,
-                dxfattribs={"layer": "POINTS"},
-            )
+            add_circle(p, radius=SIZE, dxfattribs=POINTS_ATTRIBS)
     for line in hatching.hatch_polygons(baseline, polygons):
-        msp.add_line(
-            line.start,
-            line.end,
-            dxfattribs={"layer": "HATCH"},
-        )
-        msp.add_blockref("MARKER", line.start, dxfattribs={"layer": "MARKERS"})
-        msp.add_blockref("MARKER", line.end, dxfattribs={"layer": "MARKERS"})
+        start = line.start
+        end = line.end
+        add_line(start, end, dxfattribs=HATCH_ATTRIBS)
+        add_blockref("MARKER", start, dxfattribs=MARKERS_ATTRIBS)
+        add_blockref("MARKER", end, dxfattribs=MARKERS_ATTRIBS)
 
 
 POLYGONS = [
@@ -109,7 +122,7 @@ def collinear_horizontal_hatching(filename: str):
             Vec2(), direction=Vec2(1, 0), offset=Vec2(0, 1)
         )
         render_hatch(msp, baseline, polygon, offset=Vec2(12 * index, 0))
-    doc.saveas(CWD / filename)
+    doc.saveas(cwd() / filename)
 
 
 def collinear_vertical_hatching(filename: str):
@@ -121,7 +134,7 @@ def collinear_vertical_hatching(filename: str):
             Vec2(), direction=Vec2(0, 1), offset=Vec2(1, 0)
         )
         render_hatch(msp, baseline, polygon, offset=Vec2(12 * index, 0))
-    doc.saveas(CWD / filename)
+    doc.saveas(cwd() / filename)
 
 
 def explode_hatch_pattern(filename: str):
@@ -135,7 +148,7 @@ def explode_hatch_pattern(filename: str):
             msp.add_line(start, end, attribs)
     t1 = time.perf_counter()
     print(f"Exploding hatch pattern took: {t1-t0:.3}s")
-    doc.saveas(CWD / filename.replace(".dxf", ".explode.dxf"))
+    doc.saveas(cwd() / filename.replace(".dxf", ".explode.dxf"))
 
 
 def hatch_circular_path(filename: str, size=10, angle=0):
@@ -158,7 +171,7 @@ def hatch_circular_path(filename: str, size=10, angle=0):
             line.end,
             dxfattribs={"layer": "HATCH"},
         )
-    doc.saveas(CWD / filename)
+    doc.saveas(cwd() / filename)
 
 
 def hole_examples(filename: str, size=10, dx=13, angle=0):
@@ -207,7 +220,7 @@ def hole_examples(filename: str, size=10, dx=13, angle=0):
     ]
     render_hatch(msp, baseline, forms.square(size), holes, Vec2(dx * 4, 0))
 
-    doc.saveas(CWD / filename)
+    doc.saveas(cwd() / filename)
 
 
 def debug_hatch():
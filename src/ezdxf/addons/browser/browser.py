@@ -34,7 +34,6 @@ from .model import (
 )
 from .data import (
     DXFDocument,
-    get_row_from_line_number,
     dxfstr,
     EntityHistory,
     SearchIndex,
@@ -480,9 +479,7 @@ class DXFStructureBrowser(QtWidgets.QMainWindow):
             )
             self._dxf_tags_table.setModel(model)
             if select_line_number is not None:
-                row = get_row_from_line_number(
-                    model.compiled_tags(), start_line_number, select_line_number
-                )
+                row = model.row_from_line_number(select_line_number)
                 self._dxf_tags_table.selectRow(row)
                 index = self._dxf_tags_table.model().index(row, 0)
                 self._dxf_tags_table.scrollTo(index)
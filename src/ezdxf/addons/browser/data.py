@@ -3,6 +3,10 @@
 from __future__ import annotations
 from typing import Optional, Iterable, Any, TYPE_CHECKING
 from pathlib import Path
+import bisect
+import collections
+import re
+import sys
 from ezdxf.addons.browser.loader import load_section_dict
 from ezdxf.lldxf.types import DXFVertex, tag_type
 from ezdxf.lldxf.tags import Tags
@@ -31,7 +35,9 @@ class DXFDocument:
         # debugging of DXF files (-b for backup):
         # ezdxf strip -b <your.dxf>
         self.sections: SectionDict = dict()
-        self.entity_index: Optional[EntityIndex] = None
+        # The entity index is built on first access, see property entity_index
+        self._entity_index: Optional[EntityIndex] = None
+        self._requires_entity_index = False
         self.valid_handles = None
         self.filename = ""
         if sections:
@@ -41,6 +47,13 @@ class DXFDocument:
     def filepath(self):
         return Path(self.filename)
 
+    @property
+    def entity_index(self) -> Optional[EntityIndex]:
+        if self._requires_entity_index:
+            self._entity_index = EntityIndex(self.sections)
+            self._requires_entity_index = False
+        return self._entity_index
+
     @property
     def max_line_number(self) -> int:
         if self.entity_index:
@@ -54,7 +67,9 @@ class DXFDocument:
 
     def update(self, sections: SectionDict):
         self.sections = sections
-        self.entity_index = EntityIndex(self.sections)
+        # defer the time-consuming indexing until first usage:
+        self._entity_index = None
+        self._requires_entity_index = True
 
     def absolute_filepath(self):
         return self.filepath.absolute()
@@ -102,10 +117,15 @@ class EntityIndex:
         # dict() entries have to be ordered since Python 3.6!
         # Therefore _index.values() returns the DXF entities in file order!
         self._index: dict[str, IndexEntry] = dict()
-        # Index dummy handle of entities without handles by the id of the
-        # first tag for faster retrieval of the dummy handle from tags:
+        # Index the handles of all entities by the id of the first tag for
+        # faster retrieval of the handle from tags, this includes the dummy
+        # handles of entities without handles:
         # dict items: (id, handle)
-        self._dummy_handle_index: dict[int, str] = dict()
+        self._handle_index: dict[int, str] = dict()
+        # Start line numbers of all entities in file order, for a binary search
+        # of the entity at a certain line number:
+        self._start_line_numbers: list[int] = []
+        self._entries: list[IndexEntry] = []
         self._max_line_number: int = 0
         self._build(sections)
 
@@ -113,7 +133,9 @@ class EntityIndex:
         start_line_number = 1
         dummy_handle = 1
         entity_index: dict[str, IndexEntry] = dict()
-        dummy_handle_index: dict[int, str] = dict()
+        handle_index: dict[int, str] = dict()
+        entries: list[IndexEntry] = []
+        start_line_numbers: list[int] = []
         prev_entry: Optional[IndexEntry] = None
         for section in sections.values():
             for tags in section:
@@ -123,15 +145,19 @@ class EntityIndex:
                     handle = tags.get_handle().upper()
                 except ValueError:
                     handle = f"*{dummy_handle:X}"
-                    # index dummy handle by id of the first tag:
-                    dummy_handle_index[id(tags[0])] = handle
                     dummy_handle += 1
+                # handles are stored as interned upper case strings
+                handle = sys.intern(handle)
+                # index handle by id of the first tag:
+                handle_index[id(tags[0])] = handle
 
                 next_entry = IndexEntry(tags, start_line_number)
                 if prev_entry is not None:
                     next_entry.prev = prev_entry
                     prev_entry.next = next_entry
                 entity_index[handle] = next_entry
+                entries.append(next_entry)
+                start_line_numbers.append(start_line_number)
                 prev_entry = next_entry
 
                 # calculate next start line number:
@@ -142,17 +168,27 @@ class EntityIndex:
         # subtract 1 and 2 for the last ENDSEC tag!
         self._max_line_number = start_line_number - 3
         self._index = entity_index
-        self._dummy_handle_index = dummy_handle_index
+        self._handle_index = handle_index
+        self._entries = entries
+        self._start_line_numbers = start_line_numbers
 
     def __contains__(self, handle: str) -> bool:
-        return handle.upper() in self._index
+        return self._get_entry(handle) is not None
 
     @property
     def max_line_number(self) -> int:
         return self._max_line_number
 
+    def _get_entry(self, handle: str) -> Optional[IndexEntry]:
+        # Handles are mostly upper case strings, convert the handle only
+        # for a second lookup:
+        index_entry = self._index.get(handle)
+        if index_entry is None:
+            index_entry = self._index.get(handle.upper())
+        return index_entry
+
     def get(self, handle: str) -> Optional[Tags]:
-        index_entry = self._index.get(handle.upper())
+        index_entry = self._get_entry(handle)
         if index_entry is not None:
             return index_entry.tags
         else:
@@ -161,17 +197,20 @@ class EntityIndex:
     def get_handle(self, entity: Tags) -> Optional[str]:
         if not len(entity):
             return None
-
+        # fast retrieval of the handle of indexed tags without searching the
+        # handle tag, also the only way to get the dummy handles:
+        handle = self._handle_index.get(id(entity[0]))
+        if handle is not None:
+            return handle
         try:
             return entity.get_handle()
         except ValueError:
-            # fast retrieval of dummy handle which isn't stored in tags:
-            return self._dummy_handle_index.get(id(entity[0]))
+            return None
 
     def next_entity(self, entity: Tags) -> Tags:
         handle = self.get_handle(entity)
         if handle:
-            index_entry = self._index.get(handle)
+            index_entry = self._get_entry(handle)
             next_entry = index_entry.next  # type: ignore
             # next of last entity is None!
             if next_entry:
@@ -181,7 +220,7 @@ class EntityIndex:
     def previous_entity(self, entity: Tags) -> Tags:
         handle = self.get_handle(entity)
         if handle:
-            index_entry = self._index.get(handle)
+            index_entry = self._get_entry(handle)
             prev_entry = index_entry.prev  # type: ignore
             # prev of first entity is None!
             if prev_entry:
@@ -191,18 +230,17 @@ class EntityIndex:
     def get_start_line_for_entity(self, entity: Tags) -> int:
         handle = self.get_handle(entity)
         if handle:
-            index_entry = self._index.get(handle)
+            index_entry = self._get_entry(handle)
             if index_entry:
                 return index_entry.start_line_number
         return 0
 
     def get_entity_at_line(self, number: int) -> Optional[Tags]:
-        tags = None
-        for index_entry in self._index.values():
-            if index_entry.start_line_number > number:
-                return tags  # tags of previous entry!
-            tags = index_entry.tags
-        return tags
+        # index of the last entity which starts at or before the given line:
+        index = bisect.bisect_right(self._start_line_numbers, number) - 1
+        if index < 0:
+            return None
+        return self._entries[index].tags
 
 
 def get_row_from_line_number(
@@ -223,12 +261,16 @@ def get_row_from_line_number(
 
 
 def dxfstr(tags: Tags) -> str:
-    return "".join(tag.dxfstr() for tag in tags)
+    return "".join([tag.dxfstr() for tag in tags])
 
 
 class EntityHistory:
-    def __init__(self) -> None:
-        self._history: list[Tags] = list()
+    def __init__(self, max_length: int = 256) -> None:
+        # The oldest entities are removed if the history exceeds max_length,
+        # this limits the memory usage of long browser sessions.
+        self._history: collections.deque[Tags] = collections.deque(
+            maxlen=max_length
+        )
         self._index: int = 0
         self._time_travel: list[Tags] = list()
 
@@ -248,13 +290,12 @@ class EntityHistory:
         if self._time_travel:
             self._history.extend(self._time_travel)
             self._time_travel.clear()
-        count = len(self._history)
-        if count:
+        if self._history:
             # only append if different to last entity
             if self._history[-1] is entity:
                 return
-        self._index = count
         self._history.append(entity)
+        self._index = len(self._history) - 1
 
     def back(self) -> Optional[Tags]:
         entity = None
@@ -292,10 +333,19 @@ class SearchIndex:
 
     def __init__(self, entities: Iterable[Tags]):
         self.entities: list[Tags] = list(entities)
+        # index of entities by the id() of their first tag for fast cursor
+        # placement, copies of the entity tags share the same tag objects:
+        self._entity_indices: dict[int, int] = self._build_entity_indices()
         self._current_entity_index: int = 0
         self._current_tag_index: int = 0
         self._search_term: Optional[str] = None
         self._search_term_lower: Optional[str] = None
+        # search pattern for the regular expression mode, compiled at the first
+        # search for each search term and options:
+        self._pattern: Optional[re.Pattern] = None
+        self._pattern_key: Optional[tuple[str, int]] = None
+        # cache of lower case tag values for case insensitive searching:
+        self._lower_values: dict[str, str] = dict()
         self._backward = False
         self._end_of_index = not bool(self.entities)
         self.case_insensitive = True
@@ -311,16 +361,36 @@ class SearchIndex:
     def search_term(self) -> Optional[str]:
         return self._search_term
 
+    def _build_entity_indices(self) -> dict[int, int]:
+        return {
+            id(entity[0]): index
+            for index, entity in enumerate(self.entities)
+            if len(entity)
+        }
+
+    def _get_entity_index(self, entity: Tags) -> Optional[int]:
+        if len(entity):
+            entity_index = self._entity_indices.get(id(entity[0]))
+            if entity_index is not None:
+                return entity_index
+        try:  # slow search for entities with new tag objects
+            return self.entities.index(entity)
+        except ValueError:
+            return None
+
     def set_current_entity(self, entity: Tags, tag_index: int = 0):
         self._current_tag_index = tag_index
-        try:
-            self._current_entity_index = self.entities.index(entity)
-        except ValueError:
+        entity_index = self._get_entity_index(entity)
+        if entity_index is None:
             self.reset_cursor()
+        else:
+            self._current_entity_index = entity_index
 
     def update_entities(self, entities: list[Tags]):
         current_entity, index = self.current_entity()
         self.entities = entities
+        self._entity_indices = self._build_entity_indices()
+        self._lower_values.clear()
         if current_entity:
             self.set_current_entity(current_entity, index)
 
@@ -401,7 +471,20 @@ class SearchIndex:
     def find_backwards(self) -> tuple[Optional[Tags], int]:
         return self._find(self.move_cursor_backward)
 
+    def _update_pattern(self) -> None:
+        flags = re.IGNORECASE if self.case_insensitive else 0
+        key = (self._search_term or "", flags)
+        if key == self._pattern_key:
+            return
+        self._pattern_key = key
+        try:
+            self._pattern = re.compile(key[0], flags)
+        except re.error:
+            self._pattern = None  # an invalid pattern matches nothing
+
     def _find(self, move_cursor) -> tuple[Optional[Tags], int]:
+        if self.regex:
+            self._update_pattern()
         if self.entities and self._search_term and not self._end_of_index:
             while not self._end_of_index:
                 entity, tag_index = self.current_entity()
@@ -416,13 +499,21 @@ class SearchIndex:
                 return False
             value = str(value)
 
+        if self.regex:
+            pattern = self._pattern
+            return pattern is not None and pattern.search(value) is not None
+
         if self.case_insensitive:
             search_term = self._search_term_lower
-            value = value.lower()
+            lower_value = self._lower_values.get(value)
+            if lower_value is None:
+                lower_value = value.lower()
+                self._lower_values[value] = lower_value
+            value = lower_value
         else:
             search_term = self._search_term
 
         if self.whole_words:
-            return any(search_term == word for word in value.split())
+            return search_term in value.split()
         else:
             return search_term in value
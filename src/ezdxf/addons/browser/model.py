@@ -3,6 +3,7 @@
 # mypy: ignore_errors=True
 from __future__ import annotations
 from typing import Any, Optional
+import bisect
 import textwrap
 from ezdxf.lldxf.types import (
     render_tag,
@@ -123,6 +124,14 @@ class DXFTagsModel(QAbstractTableModel):
         except IndexError:
             return 0
 
+    def row_from_line_number(self, line_number: int) -> int:
+        """Returns the widget-row of the given DXF file line number, same
+        result as the function get_row_from_line_number() but by a binary
+        search in the precalculated line numbers.
+        """
+        row = bisect.bisect_left(self._line_numbers, line_number)
+        return min(row, len(self._tags))
+
 
 class EntityContainer(QStandardItem):
     def __init__(self, name: str, entities: list[Tags]):
@@ -19,7 +19,7 @@ class UnifiedTextRenderer(TextRenderer):
     """
 
     def __init__(self, font=fonts.FontFace()) -> None:
-        self.font_manager = fonts.font_manager
+        self.font_manager = fonts.get_font_manager()
         self._default_font = font
         self._text_renderer_cache: dict[int, TTFontRenderer] = dict()
 
@@ -11,10 +11,13 @@ from typing import (
 import abc
 import copy
 from dataclasses import dataclass
+import itertools
 import json
 import random
 import time
 
+import numpy as np
+
 # example usage:
 # examples\addons\optimize\bin_packing_forms.py
 # examples\addons\optimize\tsp.py
@@ -36,8 +39,17 @@ class DNA(abc.ABC):
         ...
 
     def copy(self):
+        # fallback for custom DNA classes, the DNA classes of this module
+        # implement a faster shallow copy of their data
         return copy.deepcopy(self)
 
+    def copy_from(self, other: DNA) -> None:
+        """Copy the data and the fitness of `other` into this DNA and reuse the
+        existing data container. Both DNA must be of the same type.
+        """
+        self._data[:] = other._data
+        self.fitness = other.fitness
+
     def _taint(self):
         self.fitness = None
 
@@ -65,6 +77,11 @@ class DNA(abc.ABC):
     def flip_mutate_at(self, index: int) -> None:
         ...
 
+    def flip_mutate(self, indices: Sequence[int]) -> None:
+        """Flip mutation at all given indices."""
+        for index in indices:
+            self.flip_mutate_at(index)
+
 
 def dna_fitness(dna: DNA) -> float:
     return dna.fitness  # type: ignore
@@ -78,25 +95,30 @@ class Mutate(abc.ABC):
         ...
 
 
+def mutation_indices(length: int, rate: float) -> Sequence[int]:
+    """Returns the indices of the genes to mutate, each gene is chosen by the
+    probability `rate`.
+    """
+    rnd = random.random
+    return [index for index in range(length) if rnd() < rate]
+
+
 class FlipMutate(Mutate):
     """Flip one bit mutation."""
 
     def mutate(self, dna: DNA, rate: float):
-        for index in range(len(dna)):
-            if random.random() < rate:
-                dna.flip_mutate_at(index)
+        dna.flip_mutate(mutation_indices(len(dna), rate))
 
 
 class NeighborSwapMutate(Mutate):
     """Swap two neighbors mutation."""
 
     def mutate(self, dna: DNA, rate: float):
-        for index in range(len(dna)):
-            if random.random() < rate:
-                i2 = index - 1
-                tmp = dna[i2]
-                dna[i2] = dna[index]
-                dna[index] = tmp
+        for index in mutation_indices(len(dna), rate):
+            i2 = index - 1
+            tmp = dna[i2]
+            dna[i2] = dna[index]
+            dna[index] = tmp
 
 
 class RandomSwapMutate(Mutate):
@@ -104,14 +126,17 @@ class RandomSwapMutate(Mutate):
 
     def mutate(self, dna: DNA, rate: float):
         length = len(dna)
-        for index in range(length):
-            if random.random() < rate:
-                i2 = random.randrange(0, length)
-                if i2 == index:
-                    i2 -= 1
-                tmp = dna[i2]
-                dna[i2] = dna[index]
-                dna[index] = tmp
+        indices = mutation_indices(length, rate)
+        if not indices:
+            return
+        randrange = random.randrange
+        for index in indices:
+            i2 = randrange(0, length)
+            if i2 == index:
+                i2 -= 1
+            tmp = dna[i2]
+            dna[i2] = dna[index]
+            dna[index] = tmp
 
 
 class ReverseMutate(Mutate):
@@ -182,11 +207,7 @@ class MateUniformCX(Mate):
     """Uniform recombination."""
 
     def recombine(self, dna1: DNA, dna2: DNA):
-        for index in range(len(dna1)):
-            if random.random() > 0.5:
-                tmp = dna1[index]
-                dna1[index] = dna2[index]
-                dna2[index] = tmp
+        swap_dna_genes(dna1, dna2, mutation_indices(len(dna1), 0.5))
 
 
 class MateOrderedCX(Mate):
@@ -203,10 +224,31 @@ class MateOrderedCX(Mate):
 
 def recombine_dna_2pcx(dna1: DNA, dna2: DNA, i1: int, i2: int) -> None:
     """Two point crossover."""
-    part1 = dna1[i1:i2]
-    part2 = dna2[i1:i2]
-    dna1[i1:i2] = part2
-    dna2[i1:i2] = part1
+    data1 = dna1._data
+    data2 = dna2._data
+    part1 = dna1[i1:i2]  # a copy and not a view for numpy arrays
+    data1[i1:i2] = data2[i1:i2]
+    data2[i1:i2] = part1
+    dna1._taint()
+    dna2._taint()
+
+
+def swap_dna_genes(dna1: DNA, dna2: DNA, indices: Sequence[int]) -> None:
+    """Swap the genes of dna1 and dna2 at the given indices."""
+    if len(indices) == 0:
+        return
+    data1 = dna1._data
+    data2 = dna2._data
+    if isinstance(data1, np.ndarray) and isinstance(data2, np.ndarray):
+        # fancy indexing returns a copy
+        tmp = data1[indices]
+        data1[indices] = data2[indices]
+        data2[indices] = tmp
+    else:
+        for index in indices:
+            data1[index], data2[index] = data2[index], data1[index]
+    dna1._taint()
+    dna2._taint()
 
 
 def recombine_dna_ocx1(dna1: DNA, dna2: DNA, i1: int, i2: int) -> None:
@@ -220,33 +262,45 @@ def replace_dna_ocx1(dna1: DNA, dna2: DNA, i1: int, i2: int) -> None:
     """Replace a part in dna1 by dna2 and preserve order of remaining values in
     dna1.
     """
-    old = dna1.copy()
-    new = dna2[i1:i2]
-    dna1[i1:i2] = new
-    index = 0
+    new = list(dna2[i1:i2])
     new_set = set(new)
-    for value in old:
-        if value in new_set:
-            continue
-        if index == i1:
-            index = i2
-        dna1[index] = value
-        index += 1
+    data = list(dna1)
+    remaining = [value for value in data if value not in new_set]
+    data[i1:i2] = new
+    # fill the positions outside the replaced part in order, the DNA length is
+    # preserved for DNA with duplicate values:
+    positions = itertools.chain(range(i1), range(i2, len(data)))
+    for index, value in zip(positions, remaining):
+        data[index] = value
+    dna1[:] = data
 
 
 class FloatDNA(DNA):
-    """Arbitrary float numbers in the range [0, 1]."""
+    """Arbitrary float numbers in the range [0, 1].
+
+    The values are stored in a 1D numpy array of type float64.
+    """
 
     __slots__ = ("_data", "fitness")
 
     def __init__(self, values: Iterable[float]):
-        self._data: list[float] = list(values)
+        self._data: np.ndarray = np.fromiter(values, dtype=np.float64)
         self._check_valid_data()
         self.fitness: Optional[float] = None
 
     @classmethod
     def random(cls, length: int) -> FloatDNA:
-        return cls((random.random() for _ in range(length)))
+        rnd = random.random
+        data = np.fromiter((rnd() for _ in range(length)), np.float64, length)
+        return cls._from_valid_data(data)
+
+    @classmethod
+    def _from_valid_data(cls, data: np.ndarray) -> FloatDNA:
+        # bypasses the validation of __init__() for data known to be valid
+        dna = object.__new__(cls)
+        dna._data = data
+        dna.fitness = None
+        return dna
 
     @classmethod
     def n_random(cls, n: int, length: int) -> list[FloatDNA]:
@@ -254,26 +308,69 @@ class FloatDNA(DNA):
 
     @property
     def is_valid(self) -> bool:
-        return all(0.0 <= v <= 1.0 for v in self._data)
+        data = self._data
+        return bool(((data >= 0.0) & (data <= 1.0)).all())
 
     def _check_valid_data(self):
         if not self.is_valid:
             raise ValueError("data value out of range")
 
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self._data.tolist())})"
+
     def __str__(self):
         if self.fitness is None:
             fitness = ", fitness=None"
         else:
             fitness = f", fitness={self.fitness:.4f}"
-        return f"{str([round(v, 4) for v in self._data])}{fitness}"
+        return f"{str(self._data.round(4).tolist())}{fitness}"
+
+    def __eq__(self, other):
+        assert isinstance(other, self.__class__)
+        return np.array_equal(self._data, other._data)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            # return a copy and not a view of the underlying data
+            return self._data[item].copy()
+        return self._data[item]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice) and not isinstance(value, np.ndarray):
+            value = list(value)  # supports iterators like reversed()
+        self._data[key] = value
+        self._taint()
+
+    def copy(self) -> FloatDNA:
+        if type(self) is not FloatDNA:  # subclasses may have more attributes
+            return super().copy()
+        dna = object.__new__(FloatDNA)
+        dna._data = self._data.copy()
+        dna.fitness = self.fitness
+        return dna
+
+    def copy_from(self, other: DNA) -> None:
+        if len(self._data) == len(other._data):
+            self._data[:] = other._data
+        else:  # numpy arrays can not be resized by slice assignment
+            self._data = other._data.copy()
+        self.fitness = other.fitness
 
     def reset(self, values: Iterable[float]):
-        self._data = list(values)
+        self._data = np.fromiter(values, dtype=np.float64)
         self._check_valid_data()
         self._taint()
 
     def flip_mutate_at(self, index: int) -> None:
         self._data[index] = 1.0 - self._data[index]  # flip pick location
+        self._taint()
+
+    def flip_mutate(self, indices: Sequence[int]) -> None:
+        if len(indices) == 0:
+            return
+        data = self._data
+        data[indices] = 1.0 - data[indices]
+        self._taint()
 
 
 class BitDNA(DNA):
@@ -291,7 +388,12 @@ class BitDNA(DNA):
 
     @classmethod
     def random(cls, length: int) -> BitDNA:
-        return cls(bool(random.randint(0, 1)) for _ in range(length))
+        if length < 1:
+            return cls(())
+        # draw all bits at once instead of calling randint() for each bit
+        bits = random.getrandbits(length)
+        # the least significant bit is the first gene
+        return cls(digit == "1" for digit in reversed(f"{bits:0{length}b}"))
 
     @classmethod
     def n_random(cls, n: int, length: int) -> list[BitDNA]:
@@ -304,12 +406,21 @@ class BitDNA(DNA):
             fitness = f", fitness={self.fitness:.4f}"
         return f"{str([int(v) for v in self._data])}{fitness}"
 
+    def copy(self) -> BitDNA:
+        if type(self) is not BitDNA:  # subclasses may have more attributes
+            return super().copy()
+        dna = object.__new__(BitDNA)
+        dna._data = self._data.copy()
+        dna.fitness = self.fitness
+        return dna
+
     def reset(self, values: Iterable) -> None:
         self._data = list(bool(v) for v in values)
         self._taint()
 
     def flip_mutate_at(self, index: int) -> None:
         self._data[index] = not self._data[index]
+        self._taint()
 
 
 class UniqueIntDNA(DNA):
@@ -356,6 +467,14 @@ class UniqueIntDNA(DNA):
             fitness = f", fitness={self.fitness:.4f}"
         return f"{str([int(v) for v in self._data])}{fitness}"
 
+    def copy(self) -> UniqueIntDNA:
+        if type(self) is not UniqueIntDNA:  # subclasses may have more attributes
+            return super().copy()
+        dna = object.__new__(UniqueIntDNA)
+        dna._data = self._data.copy()
+        dna.fitness = self.fitness
+        return dna
+
     def reset(self, values: Iterable) -> None:
         self._data = list(int(v) for v in values)
         self._taint()
@@ -381,7 +500,13 @@ class IntegerDNA(DNA):
     @classmethod
     def random(cls, length: int, max_: int) -> IntegerDNA:
         imax = int(max_)
-        return cls((random.randrange(0, imax) for _ in range(length)), imax)
+        # bypass the validation of __init__(), the random values are valid
+        dna = object.__new__(cls)
+        dna._max = imax
+        randrange = random.randrange
+        dna._data = [randrange(0, imax) for _ in range(length)]
+        dna.fitness = None
+        return dna
 
     @classmethod
     def n_random(cls, n: int, length: int, max_: int) -> list[IntegerDNA]:
@@ -389,7 +514,10 @@ class IntegerDNA(DNA):
 
     @property
     def is_valid(self) -> bool:
-        return all(0 <= v < self._max for v in self._data)
+        data = self._data
+        if not data:
+            return True
+        return min(data) >= 0 and max(data) < self._max
 
     def __repr__(self):
         return f"{self.__class__.__name__}({str(self._data)}, {self._max})"
@@ -401,12 +529,27 @@ class IntegerDNA(DNA):
             fitness = f", fitness={self.fitness:.4f}"
         return f"{str([int(v) for v in self._data])}{fitness}"
 
+    def copy(self) -> IntegerDNA:
+        if type(self) is not IntegerDNA:  # subclasses may have more attributes
+            return super().copy()
+        dna = object.__new__(IntegerDNA)
+        dna._max = self._max
+        dna._data = self._data.copy()
+        dna.fitness = self.fitness
+        return dna
+
+    def copy_from(self, other: DNA) -> None:
+        assert isinstance(other, IntegerDNA)
+        super().copy_from(other)
+        self._max = other._max
+
     def reset(self, values: Iterable) -> None:
         self._data = list(int(v) for v in values)
         self._taint()
 
     def flip_mutate_at(self, index: int) -> None:
         self._data[index] = self._max - self._data[index] - 1
+        self._taint()
 
 
 class Selection(abc.ABC):
@@ -498,6 +641,17 @@ def threshold_filter(
     return (c for c in candidates if c.fitness > min_value)  # type: ignore
 
 
+_BUILTIN_DNA_TYPES = (FloatDNA, BitDNA, UniqueIntDNA, IntegerDNA)
+
+
+def _is_recyclable(dna_type: type[DNA]) -> bool:
+    """Returns ``True`` if DNA of type `dna_type` can be reused by
+    :meth:`DNA.copy_from`. Custom DNA classes may have additional attributes,
+    which are only copied if the class overrides the :meth:`copy_from` method.
+    """
+    return dna_type in _BUILTIN_DNA_TYPES or "copy_from" in vars(dna_type)
+
+
 class GeneticOptimizer:
     """A genetic algorithm (GA) is a meta-heuristic inspired by the process of
     natural selection. Genetic algorithms are commonly used to generate
@@ -514,6 +668,16 @@ class GeneticOptimizer:
 
         optimizer.reset_fitness(-1e99)
 
+    The fitness of all new DNA strands of a generation is evaluated by a
+    single call of the :attr:`map` function, which is the builtin :func:`map`
+    by default. Replace it by the map method of an executor to evaluate the
+    DNA strands in parallel, the evaluator has to be picklable for a process
+    pool::
+
+        with ProcessPoolExecutor() as executor:
+            optimizer.map = executor.map
+            optimizer.execute()
+
     """
 
     def __init__(
@@ -534,6 +698,8 @@ class GeneticOptimizer:
         self.selection: Selection = RouletteSelection()
         self.mate: Mate = Mate2pCX()
         self.mutation = FlipMutate()
+        # map(evaluate, dna_strands) -> fitness values
+        self.map: Callable = map
 
         # options:
         self.max_generations = int(max_generations)
@@ -555,6 +721,10 @@ class GeneticOptimizer:
         self.best_fitness: float = 0.0
         self.stagnation: int = 0  # generations without improvement
         self.hall_of_fame = HallOfFame(10)
+        # DNA of the previous generation to recycle for the next generation:
+        self._dna_pool: list[DNA] = []
+        # new offspring of the current generation, None for unknown:
+        self._unscored: Optional[list[DNA]] = None
 
     def reset_fitness(self, value: float) -> None:
         self.best_fitness = float(value)
@@ -602,14 +772,14 @@ class GeneticOptimizer:
 
     def measure_fitness(self) -> None:
         self.stagnation += 1
-        fitness_sum: float = 0.0
-        for dna in self.candidates:
-            if dna.fitness is not None:
-                fitness_sum += dna.fitness
-                continue
-            fitness = self.evaluator.evaluate(dna)
+        unscored = self._unscored
+        if unscored is None:  # e.g. the initial candidates
+            unscored = [dna for dna in self.candidates if dna.fitness is None]
+        self._unscored = None
+
+        fitness_values = self.map(self.evaluator.evaluate, unscored)
+        for dna, fitness in zip(unscored, fitness_values):
             dna.fitness = fitness
-            fitness_sum += fitness
             self.hall_of_fame.add(dna)
             if fitness > self.best_fitness:
                 self.best_fitness = fitness
@@ -617,10 +787,9 @@ class GeneticOptimizer:
                 self.stagnation = 0
 
         self.hall_of_fame.purge()
-        try:
-            avg_fitness = fitness_sum / len(self.candidates)
-        except ZeroDivisionError:
-            avg_fitness = 0.0
+        fitness_sum = sum(dna.fitness for dna in self.candidates)  # type: ignore
+        count = len(self.candidates)
+        avg_fitness = fitness_sum / count if count else 0.0
         self.log.add(
             time.perf_counter() - self.start_time,
             self.best_fitness,
@@ -630,6 +799,7 @@ class GeneticOptimizer:
     def next_generation(self) -> None:
         count = len(self.candidates)
         candidates: list[DNA] = []
+        unscored: list[DNA] = []
         selector = self.selection
         selector.reset(self.filter_threshold(self.candidates))
 
@@ -638,14 +808,44 @@ class GeneticOptimizer:
 
         while len(candidates) < count:
             dna1, dna2 = selector.pick(2)
-            dna1 = dna1.copy()
-            dna2 = dna2.copy()
+            dna1 = self.clone(dna1)
+            dna2 = self.clone(dna2)
             self.recombine(dna1, dna2)
             self.mutate(dna1, dna2)
             candidates.append(dna1)
             candidates.append(dna2)
+            # unchanged offspring keep the fitness of their parents
+            if dna1.fitness is None:
+                unscored.append(dna1)
+            if dna2.fitness is None:
+                unscored.append(dna2)
+        self._unscored = unscored
+        self._dna_pool = self._unused_dna(self.candidates)
         self.candidates = candidates
 
+    def clone(self, dna: DNA) -> DNA:
+        """Returns a copy of `dna`, reuses a DNA of the previous generation if
+        available.
+        """
+        pool = self._dna_pool
+        if pool and type(pool[-1]) is type(dna):
+            clone = pool.pop()
+            clone.copy_from(dna)
+            return clone
+        return dna.copy()
+
+    def _unused_dna(self, candidates: Iterable[DNA]) -> list[DNA]:
+        # The hall of fame is purged and the best DNA and the elite DNA are
+        # members of the hall of fame or referenced by the best_dna attribute.
+        used = {id(dna) for dna in self.hall_of_fame}
+        used.add(id(self.best_dna))
+        unused: dict[int, DNA] = dict()
+        for dna in candidates:
+            key = id(dna)
+            if key not in used and _is_recyclable(type(dna)):
+                unused[key] = dna
+        return list(unused.values())
+
     def filter_threshold(self, candidates: Sequence[DNA]) -> Iterable[DNA]:
         if self.threshold > 0.0:
             return threshold_filter(
@@ -674,20 +874,28 @@ class RouletteSelection(Selection):
     def __init__(self, negative_values: bool = False) -> None:
         self._candidates: list[DNA] = []
         self._weights: list[float] = []
+        self._cum_weights: list[float] = []
         self._negative_values = bool(negative_values)
 
     def reset(self, candidates: Iterable[DNA]):
         # dna.fitness is not None here!
         self._candidates = list(candidates)
         if self._negative_values:
-            self._weights = list(
+            self._set_weights(
                 conv_negative_weights(dna.fitness for dna in self._candidates)  # type: ignore
             )
         else:
-            self._weights = [dna.fitness for dna in self._candidates]  # type: ignore
+            self._set_weights(dna.fitness for dna in self._candidates)  # type: ignore
+
+    def _set_weights(self, weights: Iterable[float]) -> None:
+        self._weights = list(weights)
+        # random.choices() accumulates the weights at each call otherwise
+        self._cum_weights = list(itertools.accumulate(self._weights))
 
     def pick(self, count: int) -> Iterable[DNA]:
-        return random.choices(self._candidates, self._weights, k=count)
+        return random.choices(
+            self._candidates, cum_weights=self._cum_weights, k=count
+        )
 
 
 class RankBasedSelection(RouletteSelection):
@@ -699,7 +907,7 @@ class RankBasedSelection(RouletteSelection):
         self._candidates.sort(key=dna_fitness)  # type: ignore
         # weight of best_fitness == len(strands)
         # and decreases until 1 for the least fitness
-        self._weights = list(range(1, len(self._candidates) + 1))
+        self._set_weights(range(1, len(self._candidates) + 1))
 
 
 class TournamentSelection(Selection):
@@ -713,9 +921,8 @@ class TournamentSelection(Selection):
         self._candidates = list(candidates)
 
     def pick(self, count: int) -> Iterable[DNA]:
+        choices = random.choices
         for _ in range(count):
-            values = [
-                random.choice(self._candidates) for _ in range(self.candidates)
-            ]
+            values = choices(self._candidates, k=self.candidates)
             values.sort(key=dna_fitness)  # type: ignore
             yield values[-1]
@@ -1,10 +1,12 @@
 #  Copyright (c) 2023, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
-from typing import Iterable, NamedTuple, Optional, Sequence
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
 import os
+import mmap
 import platform
 import json
+import sys
 
 from pathlib import Path
 from fontTools.ttLib import TTFont
@@ -42,12 +44,31 @@ DEFAULT_FONTS = [
     "LiberationSans-Regular.ttf",
     "OpenSans-Regular.ttf",
 ]
-CURRENT_CACHE_VERSION = 1
+CURRENT_CACHE_VERSION = 2
 
 
 class CacheEntry(NamedTuple):
     file_path: Path  # full file path e.g. "C:\Windows\Fonts\DejaVuSans.ttf"
     font_face: FontFace
+    # file state at scanning time, to detect unchanged files at rebuilding:
+    mtime_ns: int = 0
+    size: int = 0
+    # lowercase family and style names for case-insensitive filtering:
+    family_key: str = ""
+    style_key: str = ""
+
+    @classmethod
+    def create(
+        cls, file_path: Path, font_face: FontFace, mtime_ns: int = 0, size: int = 0
+    ) -> CacheEntry:
+        return cls(
+            file_path,
+            font_face,
+            mtime_ns,
+            size,
+            font_face.family.lower(),
+            font_face.style.lower(),
+        )
 
 
 GENERIC_FONT_FAMILY = {
@@ -64,10 +85,15 @@ class FontCache:
         self._cache: dict[str, CacheEntry] = dict()
 
     def __contains__(self, font_name: str) -> bool:
-        return self.key(font_name) in self._cache
+        cache = self._cache
+        return font_name in cache or self.key(font_name) in cache
 
     def __getitem__(self, item: str) -> CacheEntry:
-        return self._cache[self.key(item)]
+        # fast path for lowercase font names:
+        entry = self._cache.get(item)
+        if entry is None:
+            return self._cache[self.key(item)]
+        return entry
 
     def __len__(self):
         return len(self._cache)
@@ -79,14 +105,43 @@ class FontCache:
     def key(font_name: str) -> str:
         return str(font_name).lower()
 
-    def add_entry(self, font_path: Path, font_face: FontFace) -> None:
-        self._cache[self.key(font_path.name)] = CacheEntry(font_path, font_face)
+    @staticmethod
+    def insert_key(font_name: str) -> str:
+        """Returns the interned cache key for storing new entries."""
+        return sys.intern(str(font_name).lower())
+
+    def add_entry(
+        self, font_path: Path, font_face: FontFace, mtime_ns: int = 0, size: int = 0
+    ) -> None:
+        self._cache[self.insert_key(font_path.name)] = CacheEntry.create(
+            font_path, font_face, mtime_ns, size
+        )
+
+    def get_unchanged_font_face(
+        self, font_path: Path, mtime_ns: int, size: int
+    ) -> Optional[FontFace]:
+        """Returns the cached font face if the font file at `font_path` has the same
+        modification time and size as at scanning time, otherwise ``None``.
+        """
+        entry = self._cache.get(self.key(font_path.name), None)
+        if (
+            entry is not None
+            and entry.mtime_ns == mtime_ns
+            and entry.size == size
+            and entry.file_path == font_path
+        ):
+            return entry.font_face
+        return None
 
     def get(self, font_name: str, fallback: str) -> CacheEntry:
-        try:
-            return self._cache[self.key(font_name)]
-        except KeyError:
-            return self._cache[self.key(fallback)]
+        cache = self._cache
+        # fast path for lowercase font names:
+        entry = cache.get(font_name)
+        if entry is None:
+            entry = cache.get(self.key(font_name))
+        if entry is None:
+            return cache[self.key(fallback)]
+        return entry
 
     def find_best_match(self, font_face: FontFace) -> Optional[FontFace]:
         entry = self._cache.get(self.key(font_face.filename), None)
@@ -123,7 +178,7 @@ class FontCache:
         # best match by weight, italic, width
         # Note: the width property is used to prioritize shapefile types:
         # 1st .shx; 2nd: .shp; 3rd: .lff
-        result = sorted(
+        result = min(
             entries,
             key=lambda e: (
                 abs(e.font_face.weight - weight),
@@ -131,7 +186,7 @@ class FontCache:
                 abs(e.font_face.width - width),
             ),
         )
-        return result[0].font_face
+        return result.font_face
 
     def loads(self, s: str) -> None:
         cache: dict[str, CacheEntry] = dict()
@@ -147,7 +202,7 @@ class FontCache:
         if version == CURRENT_CACHE_VERSION:
             for entry in content:
                 try:
-                    file_path, family, style, weight, width = entry
+                    file_path, family, style, weight, width, mtime_ns, size = entry
                 except ValueError:
                     raise IOError("invalid cache file format")
                 path = Path(file_path)  # full path, e.g. "C:\Windows\Fonts\Arial.ttf"
@@ -158,7 +213,9 @@ class FontCache:
                     weight=weight,  # 400 (Normal)
                     width=width,  # 5 (Normal)
                 )
-                cache[self.key(path.name)] = CacheEntry(path, font_face)
+                cache[self.insert_key(path.name)] = CacheEntry.create(
+                    path, font_face, mtime_ns, size
+                )
         else:
             raise IOError("invalid cache file version")
         self._cache = cache
@@ -171,21 +228,24 @@ class FontCache:
                 entry.font_face.style,
                 entry.font_face.weight,
                 entry.font_face.width,
+                entry.mtime_ns,
+                entry.size,
             )
             for entry in self._cache.values()
         ]
         data = {"version": CURRENT_CACHE_VERSION, "font-faces": faces}
-        return json.dumps(data, indent=2)
+        # compact format: the cache file is not meant to be edited
+        return json.dumps(data, separators=(",", ":"))
 
 
 def filter_family(family: str, entries: Iterable[CacheEntry]) -> list[CacheEntry]:
     key = str(family).lower()
-    return [e for e in entries if e.font_face.family.lower().startswith(key)]
+    return [e for e in entries if e.family_key.startswith(key)]
 
 
 def filter_style(style: str, entries: Iterable[CacheEntry]) -> list[CacheEntry]:
     key = str(style).lower()
-    return [e for e in entries if key in e.font_face.style.lower()]
+    return [e for e in entries if key in e.style_key]
 
 
 # TrueType and OpenType fonts:
@@ -193,6 +253,7 @@ def filter_style(style: str, entries: Iterable[CacheEntry]) -> list[CacheEntry]:
 SUPPORTED_TTF_TYPES = {".ttf", ".ttc", ".otf"}
 # Basic stroke-fonts included in CAD applications:
 SUPPORTED_SHAPE_FILES = {".shx", ".shp", ".lff"}
+SUPPORTED_FONT_TYPES = SUPPORTED_TTF_TYPES | SUPPORTED_SHAPE_FILES
 NO_FONT_FACE = FontFace()
 
 
@@ -206,6 +267,7 @@ class FontManager:
         self._font_cache: FontCache = FontCache()
         self._loaded_ttf_fonts: dict[str, TTFont] = dict()
         self._fallback_font_name = ""
+        self._fallback_entry: Optional[CacheEntry] = None
 
     def has_font(self, font_name: str) -> bool:
         return font_name in self._font_cache
@@ -213,35 +275,50 @@ class FontManager:
     def clear(self) -> None:
         self._font_cache = FontCache()
         self._loaded_ttf_fonts.clear()
+        self._reset_fallback_font()
+
+    def _reset_fallback_font(self) -> None:
         self._fallback_font_name = ""
+        self._fallback_entry = None
 
     def fallback_font_name(self) -> str:
-        fallback_name = self._fallback_font_name
-        if fallback_name:
-            return fallback_name
+        if not self._fallback_font_name:
+            self._find_fallback_font()
+        return self._fallback_font_name
+
+    def _find_fallback_font(self) -> None:
+        font_cache = self._font_cache
         fallback_name = DEFAULT_FONTS[0]
         for name in DEFAULT_FONTS:
-            try:
-                cache_entry = self._font_cache.get(name, fallback_name)
-                fallback_name = cache_entry.file_path.name
+            if name in font_cache:
+                self._fallback_entry = font_cache[name]
+                fallback_name = self._fallback_entry.file_path.name
                 break
-            except KeyError:
-                pass
         self._fallback_font_name = fallback_name
-        return fallback_name
+
+    def _get_cache_entry(self, font_name: str) -> CacheEntry:
+        """Returns the cache entry for `font_name` or the cache entry of the
+        fallback font.
+        """
+        try:
+            return self._font_cache[font_name]
+        except KeyError:
+            pass
+        if not self._fallback_font_name:
+            self._find_fallback_font()
+        if self._fallback_entry is None:
+            raise KeyError(font_name)
+        return self._fallback_entry
 
     def get_ttf_font(self, font_name: str, font_number: int = 0) -> TTFont:
         try:
             return self._loaded_ttf_fonts[font_name]
         except KeyError:
             pass
-        fallback_name = self.fallback_font_name()
         try:
-            font = TTFont(
-                self._font_cache.get(font_name, fallback_name).file_path,
-                fontNumber=font_number,
-            )
-        except IOError as e:
+            file_path = self._get_cache_entry(font_name).file_path
+            font = load_ttf_font(file_path, font_number)
+        except (IOError, ValueError) as e:  # ValueError: empty file
             raise FontNotFoundError(str(e))
         self._loaded_ttf_fonts[font_name] = font
         return font
@@ -250,8 +327,7 @@ class FontManager:
         return self.get_ttf_font(Path(font_face.filename).name)
 
     def get_font_face(self, font_name: str) -> FontFace:
-        cache_entry = self._font_cache.get(font_name, self.fallback_font_name())
-        return cache_entry.font_face
+        return self._get_cache_entry(font_name).font_face
 
     def find_best_match(
         self,
@@ -293,6 +369,7 @@ class FontManager:
         self.scan_all(dirs + list(options.support_dirs))
 
     def scan_all(self, folders: Iterable[str]) -> None:
+        self._reset_fallback_font()  # a preferred fallback font may be added
         for folder in folders:
             folder = folder.strip("'\"")  # strip quotes
             self.scan_folder(Path(folder).expanduser())
@@ -300,23 +377,38 @@ class FontManager:
     def scan_folder(self, folder: Path):
         if not folder.exists():
             return
-        for file in folder.iterdir():
-            if file.is_dir():
-                self.scan_folder(file)
-                continue
-            ext = file.suffix.lower()
-            if ext in SUPPORTED_TTF_TYPES:
-                font_face = get_ttf_font_face(file)
-                self._font_cache.add_entry(file, font_face)
-            elif ext in SUPPORTED_SHAPE_FILES:
-                font_face = get_shape_file_font_face(file)
-                self._font_cache.add_entry(file, font_face)
+        font_cache = self._font_cache
+        for file in iter_font_files(folder):
+            if file.suffix.lower() in SUPPORTED_TTF_TYPES:
+                try:
+                    stat = file.stat()
+                except OSError:  # e.g. broken symlink, unreadable file
+                    font_cache.add_entry(file, get_ttf_font_face(file))
+                    continue
+                mtime_ns, size = stat.st_mtime_ns, stat.st_size
+                # parsing TTF files is expensive, reuse font faces of unchanged files
+                font_face = font_cache.get_unchanged_font_face(file, mtime_ns, size)
+                if font_face is None:
+                    font_face = get_ttf_font_face(file)
+                font_cache.add_entry(file, font_face, mtime_ns, size)
+            else:
+                font_cache.add_entry(file, get_shape_file_font_face(file))
 
     def dumps(self) -> str:
         return self._font_cache.dumps()
 
     def loads(self, s: str) -> None:
         self._font_cache.loads(s)
+        self._reset_fallback_font()
+
+
+def iter_font_files(folder: Path) -> Iterator[Path]:
+    """Yields all supported font files located in `folder` and its subdirectories."""
+    for file in folder.iterdir():
+        if file.is_dir():
+            yield from iter_font_files(file)
+        elif file.suffix.lower() in SUPPORTED_FONT_TYPES:
+            yield file
 
 
 def normalize_style(style: str) -> str:
@@ -325,25 +417,37 @@ def normalize_style(style: str) -> str:
     return style
 
 
+def load_ttf_font(file_path: str, font_number: int = 0) -> TTFont:
+    """Returns the lazy loaded font of a memory-mapped font file.
+    Only the used pages of the font file are read and only the used tables are
+    decompiled.  The memory-mapped file is kept alive by the returned font.
+    """
+    with open(file_path, "rb") as fp:
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    return TTFont(data, fontNumber=font_number, lazy=True)
+
+
 def get_ttf_font_face(font_path: Path) -> FontFace:
     try:
-        ttf = TTFont(font_path, fontNumber=0)
+        # lazy loading: decompile only the required "name" and "OS/2" tables
+        ttf = TTFont(font_path, fontNumber=0, lazy=True)
     except IOError:
         return FontFace(filename=font_path.name)
 
-    names = ttf["name"].names
-    family = ""
-    style = ""
-    for record in names:
-        if record.nameID == 1:
-            family = record.string.decode(record.getEncoding())
-        elif record.nameID == 2:
-            style = record.string.decode(record.getEncoding())
-        if family and style:
-            break
-    os2_table = ttf["OS/2"]
-    weight = os2_table.usWeightClass
-    width = os2_table.usWidthClass
+    with ttf:
+        names = ttf["name"].names
+        family = ""
+        style = ""
+        for record in names:
+            if record.nameID == 1:
+                family = record.string.decode(record.getEncoding())
+            elif record.nameID == 2:
+                style = record.string.decode(record.getEncoding())
+            if family and style:
+                break
+        os2_table = ttf["OS/2"]
+        weight = os2_table.usWeightClass
+        width = os2_table.usWidthClass
     return FontFace(
         filename=font_path.name,
         family=family,
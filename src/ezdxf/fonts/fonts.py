@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Optional, TYPE_CHECKING, cast
 import abc
 import enum
+import functools
 import logging
 import sys
 import pathlib
@@ -23,7 +24,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger("ezdxf")
 FONT_MANAGER_CACHE_FILE = "font_manager_cache.json"
 CACHE_DIRECTORY = ".cache"
-font_manager = FontManager()
+# The global font manager is accessible as module attribute "font_manager" or by
+# get_font_manager(), the font manager cache is loaded at the first access:
+_font_manager = FontManager()
+_font_manager_loaded = False
 
 SHX_FONTS = {
     # See examples in: CADKitSamples/Shapefont.dxf
@@ -66,6 +70,8 @@ SHX_FONTS = {
     "TXT.SHX": "txt_____.ttf",
 }
 TTF_TO_SHX = {v: k for k, v in SHX_FONTS.items() if k.endswith("SHX")}
+# case-insensitive lookup table for SHX font names:
+_SHX_FONTS_CI = {sys.intern(k.casefold()): v for k, v in SHX_FONTS.items()}
 DESCENDER_FACTOR = 0.333  # from TXT SHX font - just guessing
 X_HEIGHT_FACTOR = 0.666  # from TXT SHX font - just guessing
 
@@ -73,19 +79,18 @@ X_HEIGHT_FACTOR = 0.666  # from TXT SHX font - just guessing
 def map_shx_to_ttf(font_name: str) -> str:
     """Map SHX font names to TTF file names. e.g. "TXT" -> "txt_____.ttf" """
     # Map SHX fonts to True Type Fonts:
-    font_upper = font_name.upper()
-    if font_upper in SHX_FONTS:
-        font_name = SHX_FONTS[font_upper]
-    return font_name
+    ttf = SHX_FONTS.get(font_name)  # SHX font names are usually uppercase
+    if ttf is not None:
+        return ttf
+    return _SHX_FONTS_CI.get(font_name.casefold(), font_name)
 
 
 def is_shx_font_name(font_name: str) -> bool:
-    name = font_name.upper()
-    if name.endswith(".SHX"):
-        return True
-    if "." not in name:
-        return True
-    return False
+    return (
+        "." not in font_name
+        or font_name.endswith(".SHX")
+        or font_name.casefold().endswith(".shx")
+    )
 
 
 def map_ttf_to_shx(ttf: str) -> Optional[str]:
@@ -106,7 +111,7 @@ def find_font_face(font_name: str) -> FontFace:
     returns the default font if `font_name` was not found.
 
     """
-    return font_manager.get_font_face(font_name)
+    return get_font_manager().get_font_face(font_name)
 
 
 def get_font_face(font_name: str, map_shx=True) -> FontFace:
@@ -171,19 +176,36 @@ def find_best_match(
         italic: ``True``, ``False`` or ``None`` to ignore this flag
 
     """
-    return font_manager.find_best_match(family, style, weight, width, italic)
+    return get_font_manager().find_best_match(family, style, weight, width, italic)
 
 
 def find_font_file_name(font_face: FontFace) -> str:
     """Returns the true type font file name without parent directories e.g. "Arial.ttf"."""
-    return font_manager.find_font_name(font_face)
+    return get_font_manager().find_font_name(font_face)
 
 
 def load():
     """Load all cache files."""
+    global _font_manager_loaded
+    _font_manager_loaded = True
     _load_font_manager()
 
 
+def get_font_manager() -> FontManager:
+    """Returns the global :class:`FontManager`, the font manager cache is loaded at
+    the first call.
+    """
+    if not _font_manager_loaded:
+        load()
+    return _font_manager
+
+
+def __getattr__(name: str):
+    if name == "font_manager":
+        return get_font_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _get_font_manger_path():
     cache_path = options.xdg_path("XDG_CACHE_HOME", CACHE_DIRECTORY)
     return cache_path / FONT_MANAGER_CACHE_FILE
@@ -196,7 +218,7 @@ def _load_font_manager() -> None:
     fm_path = _get_font_manger_path()
     if fm_path.exists():
         try:
-            font_manager.loads(fm_path.read_text())
+            _font_manager.loads(fm_path.read_text())
             return
         except IOError as e:
             logger.info(f"Error loading cache file: {str(e)}")
@@ -209,18 +231,18 @@ def build_sut_font_manager_cache(repo_font_path: pathlib.Path) -> None:
     Load the fonts included in the repository folder "./fonts" to guarantee the tests
     have the same fonts available on all systems.
     """
-    if font_manager.has_font("DejaVuSans.ttf"):
+    if _font_manager.has_font("DejaVuSans.ttf"):
         return
-    font_manager.clear()
+    _font_manager.clear()
     cache_file = repo_font_path / "font_manager_cache.json"
     if cache_file.exists():
         try:
-            font_manager.loads(cache_file.read_text())
+            _font_manager.loads(cache_file.read_text())
             return
         except IOError as e:
             print(f"Error loading cache file: {str(e)}")
-    font_manager.build([str(repo_font_path)])
-    s = font_manager.dumps()
+    _font_manager.build([str(repo_font_path)])
+    s = _font_manager.dumps()
     try:
         cache_file.write_text(s)
     except IOError as e:
@@ -228,8 +250,15 @@ def build_sut_font_manager_cache(repo_font_path: pathlib.Path) -> None:
 
 
 def build_font_manager_cache(path: pathlib.Path) -> None:
-    font_manager.build()
-    s = font_manager.dumps()
+    global _font_manager_loaded
+    _font_manager_loaded = True
+    if path.exists():
+        try:  # reuse the font faces of unchanged font files
+            _font_manager.loads(path.read_text())
+        except IOError as e:  # also raised for outdated cache versions
+            logger.info(f"Error loading cache file: {str(e)}")
+    _font_manager.build()
+    s = _font_manager.dumps()
     if not path.parent.exists():
         path.parent.mkdir(parents=True)
     try:
@@ -288,7 +317,6 @@ class TrueTypeFont(AbstractFont):
     """
 
     font_render_type = FontRenderType.OUTLINE
-    _ttf_render_engines: dict[str, TTFontRenderer] = dict()
 
     def __init__(self, ttf: str, cap_height: float, width_factor: float = 1.0):
         self.engine = self._create_engine(ttf)
@@ -302,17 +330,11 @@ class TrueTypeFont(AbstractFont):
         )
         self._matrix = Matrix44.scale(self.width_factor, 1.0, 1.0)
 
-    def _create_engine(self, ttf: str) -> TTFontRenderer:
-        from .ttfonts import TTFontRenderer
-
-        key = pathlib.Path(ttf).name.lower()
-        try:
-            return self._ttf_render_engines[key]
-        except KeyError:
-            pass
-        engine = TTFontRenderer(font_manager.get_ttf_font(ttf))
-        self._ttf_render_engines[key] = engine
-        return engine
+    @staticmethod
+    def _create_engine(ttf: str) -> TTFontRenderer:
+        if "/" in ttf or "\\" in ttf:
+            ttf = pathlib.Path(ttf).name
+        return _get_ttf_render_engine(ttf.lower())
 
     def text_width(self, text: str) -> float:
         """Returns the text width in drawing units for the given `text` string.
@@ -326,7 +348,7 @@ class TrueTypeFont(AbstractFont):
         """Returns the text width in drawing units, bypasses the stored `cap_height` and
         `width_factor`.
         """
-        if not text.strip():
+        if not text or text.isspace():
             return 0
         return self.engine.get_text_length(text, cap_height) * width_factor
 
@@ -350,6 +372,14 @@ class TrueTypeFont(AbstractFont):
         return self._space_width
 
 
+@functools.lru_cache(maxsize=128)
+def _get_ttf_render_engine(font_name: str) -> TTFontRenderer:
+    """Returns the shared render engine for the lowercase TTF file name `font_name`."""
+    from .ttfonts import TTFontRenderer
+
+    return TTFontRenderer(get_font_manager().get_ttf_font(font_name))
+
+
 class MonospaceFont(AbstractFont):
     """Represents a monospaced font where each letter has the same cap- and descender
     height and the same width. The given cap height and width factor are the default
@@ -478,6 +508,3 @@ def get_entity_font_face(entity: DXFEntity, doc: Optional[Drawing] = None) -> Fo
             if ttf:
                 font_face = get_font_face(ttf)
     return font_face
-
-
-_load_font_manager()
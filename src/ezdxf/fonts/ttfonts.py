@@ -1,19 +1,25 @@
 #  Copyright (c) 2023, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
-from typing import Any, no_type_check
+from typing import Any, Iterable, Iterator
+from collections import OrderedDict, defaultdict
+from itertools import accumulate, repeat
+import functools
+import operator
+import sys
 from fontTools.pens.basePen import BasePen
 from fontTools.ttLib import TTFont
 
 import ezdxf.path
-from ezdxf.math import Matrix44, UVec, BoundingBox2d
-from .font_manager import FontManager
+from ezdxf.math import UVec
 from .font_measurements import FontMeasurements
 
 UNICODE_WHITE_SQUARE = 9633  # U+25A1
 UNICODE_REPLACEMENT_CHAR = 65533  # U+FFFD
-
-font_manager = FontManager()
+TEXT_LENGTH_CACHE_SIZE = 1024
+# max. count of cached glyphs, fonts like CJK fonts have tens of thousands of
+# glyphs, but only a small subset of them is used by the most DXF documents:
+GLYPH_CACHE_SIZE = 2048
 
 
 class PathPen(BasePen):
@@ -42,39 +48,92 @@ class PathPen(BasePen):
 
 
 class NoKerning:
+    def __len__(self) -> int:
+        return 0
+
     def get(self, c0: str, c1: str) -> float:
         return 0.0
 
+    def get_kerning_values(self, s: str) -> Iterable[float]:
+        return repeat(0.0, max(len(s) - 1, 0))
+
+    def get_text_kerning(self, s: str) -> float:
+        return 0.0
+
 
 class KerningTable(NoKerning):
-    __slots__ = ("_cmap", "_kern_table")
+    __slots__ = ("_kern_table",)
+
+    def __init__(self, font: TTFont, cmap: dict[int, str], fmt: int = 0):
+        # a glyph can be mapped to many code points:
+        code_points: dict[str, list[int]] = defaultdict(list)
+        for code, glyph_name in cmap.items():
+            code_points[glyph_name].append(code)
+        # kerning values by code point pairs, requires a single lookup per char pair:
+        kern_table: dict[tuple[int, int], float] = dict()
+        subtable = font["kern"].getkern(fmt)
+        # the kerning table may not contain a subtable of the requested format:
+        items = subtable.kernTable.items() if subtable is not None else ()
+        for (name0, name1), value in items:
+            for cp0 in code_points.get(name0, ()):
+                for cp1 in code_points.get(name1, ()):
+                    kern_table[(cp0, cp1)] = value
+        self._kern_table = kern_table
 
-    def __init__(self, font: TTFont, cmap, fmt: int = 0):
-        self._cmap = cmap
-        self._kern_table = font["kern"].getkern(fmt)
+    def __len__(self) -> int:
+        return len(self._kern_table)
 
     def get(self, c0: str, c1: str) -> float:
         try:
-            return self._kern_table[(self._cmap[ord(c0)], self._cmap[ord(c1)])]
-        except (KeyError, TypeError):
+            return self._kern_table.get((ord(c0), ord(c1)), 0.0)
+        except TypeError:  # no previous char
             return 0.0
 
+    def get_kerning_values(self, s: str) -> Iterable[float]:
+        """Returns the kerning values of all char pairs of string `s`."""
+        codes = list(map(ord, s))
+        return map(self._kern_table.get, zip(codes, codes[1:]), repeat(0.0))
+
+    def get_text_kerning(self, s: str) -> float:
+        """Returns the sum of the kerning values of all char pairs of string `s`."""
+        return sum(self.get_kerning_values(s))
+
+
+def _add_to_lru_cache(cache: OrderedDict, key: str, value: Any) -> None:
+    cache[key] = value
+    while len(cache) > GLYPH_CACHE_SIZE:
+        cache.popitem(last=False)  # remove the least recently used entry
+
 
 def get_fontname(font: TTFont) -> str:
-    names = font["name"].names
-    for record in names:
+    name_table = font["name"]
+    # family name: Macintosh Roman English or Windows Unicode English (US), the
+    # Macintosh record is stored first
+    record = name_table.getName(1, 1, 0, 0) or name_table.getName(1, 3, 1, 0x409)
+    if record is not None:
+        return record.toUnicode()
+    for record in name_table.names:
         if record.nameID == 1:
-            return record.string.decode(record.getEncoding())
+            return record.toUnicode()
     return "unknown"
 
 
 class TTFontRenderer:
     def __init__(self, font: TTFont, kerning=False):
-        self._glyph_path_cache: dict[str, ezdxf.path.Path2d] = dict()
-        self._generic_glyph_cache: dict[str, Any] = dict()
+        # the glyph caches are LRU caches of limited size:
+        self._glyph_path_cache: OrderedDict[str, ezdxf.path.Path2d] = OrderedDict()
+        # glyph paths by glyph name, chars of the same glyph share the path:
+        self._glyph_name_path_cache: OrderedDict[
+            str, ezdxf.path.Path2d
+        ] = OrderedDict()
+        self._generic_glyph_cache: OrderedDict[str, Any] = OrderedDict()
         self._glyph_width_cache: dict[str, float] = dict()
         self.font = font
-        self.cmap = self.font.getBestCmap()
+        intern = sys.intern
+        # glyph names are used as keys for the glyph set
+        self.cmap = {
+            code: intern(name) for code, name in self.font.getBestCmap().items()
+        }
         self.glyph_set = self.font.getGlyphSet()
         self.kerning = NoKerning()
         if kerning:
@@ -82,22 +141,27 @@ class TTFontRenderer:
                 self.kerning = KerningTable(self.font, self.cmap)
             except KeyError:  # kerning table does not exist
                 pass
+        # skip the kerning calculations for fonts without kerning values:
+        self._has_kerning = len(self.kerning) > 0
         self.undefined_generic_glyph = self.glyph_set[".notdef"]
         self.font_measurements = self._get_font_measurements()
+        # raw lengths of recently measured strings, the same strings are measured
+        # many times, e.g. text of block references:
+        self._cached_text_length = functools.lru_cache(
+            maxsize=TEXT_LENGTH_CACHE_SIZE
+        )(self._get_text_length)
 
-    @property
+    @functools.cached_property
     def font_name(self) -> str:
         return get_fontname(self.font)
 
-    @no_type_check
     def _get_font_measurements(self) -> FontMeasurements:
-        bbox = BoundingBox2d(self.get_glyph_path("x").control_vertices())
-        baseline = bbox.extmin.y
-        x_height = bbox.extmax.y - baseline
-        bbox = BoundingBox2d(self.get_glyph_path("A").control_vertices())
-        cap_height = bbox.extmax.y - baseline
-        bbox = BoundingBox2d(self.get_glyph_path("p").control_vertices())
-        descender_height = baseline - bbox.extmin.y
+        baseline, x_top = self._get_glyph_y_extents("x")
+        x_height = x_top - baseline
+        _, cap_top = self._get_glyph_y_extents("A")
+        cap_height = cap_top - baseline
+        descender_bottom, _ = self._get_glyph_y_extents("p")
+        descender_height = baseline - descender_bottom
         return FontMeasurements(
             baseline=baseline,
             cap_height=cap_height,
@@ -105,28 +169,51 @@ class TTFontRenderer:
             descender_height=descender_height,
         )
 
+    def _get_glyph_y_extents(self, char: str) -> tuple[float, float]:
+        """Returns the min. and max. y-coordinate of the raw glyph path."""
+        y_coordinates = [v.y for v in self.get_glyph_path(char).control_vertices()]
+        return min(y_coordinates), max(y_coordinates)
+
     def get_generic_glyph(self, char: str):
+        cache = self._generic_glyph_cache
         try:
-            return self._generic_glyph_cache[char]
+            generic_glyph = cache[char]
         except KeyError:
             pass
+        else:
+            cache.move_to_end(char)
+            return generic_glyph
         try:
             generic_glyph = self.glyph_set[self.cmap[ord(char)]]
         except KeyError:
             generic_glyph = self.undefined_generic_glyph
-        self._generic_glyph_cache[char] = generic_glyph
+        _add_to_lru_cache(cache, char, generic_glyph)
         return generic_glyph
 
     def get_glyph_path(self, char: str) -> ezdxf.path.Path2d:
         """Returns the raw glyph path, without any scaling applied."""
+        cache = self._glyph_path_cache
         try:
-            return self._glyph_path_cache[char]
+            glyph_path = cache[char]
         except KeyError:
             pass
-        pen = PathPen(self.glyph_set)
-        self.get_generic_glyph(char).draw(pen)
-        glyph_path = pen.path
-        self._glyph_path_cache[char] = glyph_path
+        else:
+            cache.move_to_end(char)
+            return glyph_path
+        generic_glyph = self.get_generic_glyph(char)
+        # all undefined chars are rendered by the same ".notdef" glyph
+        glyph_name = getattr(generic_glyph, "name", None)
+        name_cache = self._glyph_name_path_cache
+        glyph_path = name_cache.get(glyph_name)  # type: ignore
+        if glyph_path is None:
+            pen = PathPen(self.glyph_set)
+            generic_glyph.draw(pen)
+            glyph_path = pen.path
+            if glyph_name is not None:
+                _add_to_lru_cache(name_cache, glyph_name, glyph_path)
+        else:
+            name_cache.move_to_end(glyph_name)  # type: ignore
+        _add_to_lru_cache(cache, char, glyph_path)
         return glyph_path
 
     def get_glyph_width(self, char: str) -> float:
@@ -146,43 +233,46 @@ class TTFontRenderer:
     def get_text_path(self, s: str, cap_height: float = 1.0) -> ezdxf.path.Path2d:
         """Returns the concatenated glyph paths of string s, scaled to cap height."""
         text_path = ezdxf.path.Path2d()
-        x_offset: float = 0
-        requires_kerning = isinstance(self.kerning, KerningTable)
         resize_factor = self.get_scaling_factor(cap_height)
-        # set scaling factor:
-        m = Matrix44.scale(resize_factor, resize_factor, 1.0)
-        # set vertical offset:
-        m[3, 1] = -self.font_measurements.baseline * resize_factor
-        prev_char = ""
-        for char in s:
-            if requires_kerning:
-                x_offset += self.kerning.get(prev_char, char) * resize_factor
-            # set horizontal offset:
-            m[3, 0] = x_offset
-            glyph_path = self.get_glyph_path(char).transform(m)
-            if x_offset == 0:
-                text_path = glyph_path
-            elif len(glyph_path):
-                text_path.extend_multi_path(glyph_path)
-            x_offset += self.get_glyph_width(char) * resize_factor
-            prev_char = char
+        # vertical offset:
+        y_offset = -self.font_measurements.baseline * resize_factor
+        extend = text_path.extend_multi_path_scaled  # ignores empty glyph paths
+        get_glyph_path = self.get_glyph_path
+        for char, x_offset in zip(s, self._get_char_offsets(s)):
+            # pure scaling and translation, no full matrix transformation required:
+            extend(
+                get_glyph_path(char),
+                resize_factor,
+                resize_factor,
+                x_offset * resize_factor,
+                y_offset,
+            )
         return text_path
 
+    def _get_char_offsets(self, s: str) -> Iterator[float]:
+        """Returns the raw horizontal offset of each char of string `s`, without any
+        scaling applied.
+        """
+        # advance from each char to the next char:
+        advances: Iterable[float] = map(self.get_glyph_width, s[:-1])
+        if self._has_kerning:
+            advances = map(operator.add, advances, self.kerning.get_kerning_values(s))
+        return accumulate(advances, initial=0.0)
+
     def get_scaling_factor(self, cap_height: float) -> float:
         return 1.0 / self.font_measurements.cap_height * cap_height
 
-    def _get_text_length_with_kerning(self, s: str, cap_height: float = 1.0) -> float:
-        length = 0.0
-        c0 = ""
-        kern = self.kerning.get
-        width = self.get_glyph_width
-        for c1 in s:
-            length += kern(c0, c1) + width(c1)
-            c0 = c1
-        return length * self.get_scaling_factor(cap_height)
+    def _get_text_length(self, s: str) -> float:
+        """Returns the raw text length, without any scaling applied."""
+        widths = self._glyph_width_cache
+        try:  # fast path: all glyph widths are cached
+            length = sum(map(widths.__getitem__, s))
+        except KeyError:
+            width = self.get_glyph_width
+            length = sum(width(c) for c in s)
+        if self._has_kerning:
+            length += self.kerning.get_text_kerning(s)
+        return length
 
     def get_text_length(self, s: str, cap_height: float = 1.0) -> float:
-        if isinstance(self.kerning, KerningTable):
-            return self._get_text_length_with_kerning(s, cap_height)
-        width = self.get_glyph_width
-        return sum(width(c) for c in s) * self.get_scaling_factor(cap_height)
+        return self._cached_text_length(s) * self.get_scaling_factor(cap_height)
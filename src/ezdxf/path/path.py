@@ -453,10 +453,27 @@ class AbstractPath(Generic[T], abc.ABC):
         (empty paths).
 
         """
-        if len(path):
-            self.move_to(path.start)
+        if len(path) == 0:
+            return
+        self.move_to(path.start)
+        if path._pnt_class is not self._pnt_class:
             for cmd in path.commands():
                 self.append_path_element(cmd)
+            return
+        # vertices are immutable - no copying required
+        self._extend_commands(path)
+        self._vertices.extend(path._vertices[1:])
+
+    def _extend_commands(self, path: AbstractPath) -> None:
+        # Copy the command data of the source path, the start vertex of the source
+        # path has to be the last vertex of this path and the vertices of the
+        # source path have to be appended after calling this method.
+        # The first command of a path can not be a MOVE_TO command.
+        offset = len(self._vertices) - 1  # index of the start vertex
+        self._start_index.extend([index + offset for index in path._start_index])
+        self._commands.extend(path._commands)
+        if path._has_sub_paths:
+            self._has_sub_paths = True
 
     def append_path(self, path: AbstractPath[T]) -> None:
         """Append another path to this path. Adds a :code:`self.line_to(path.start)`
@@ -571,3 +588,38 @@ class Path2d(AbstractPath[Vec2]):
         new_path = self.clone()
         new_path._vertices = list(m.fast_2d_transform(self._vertices))
         return new_path
+
+    def scale_translate(
+        self, sx: float, sy: float, tx: float = 0.0, ty: float = 0.0
+    ) -> Self:
+        """Returns a new 2D path, scaled by `sx` and `sy` and translated by `tx` and
+        `ty`. Faster than :meth:`transform` for this simple case, because no full
+        matrix multiplication is required.
+
+        .. versionadded:: 1.1
+
+        """
+        new_path = self.clone()
+        new_path._vertices = [
+            Vec2(v.x * sx + tx, v.y * sy + ty) for v in self._vertices
+        ]
+        return new_path
+
+    def extend_multi_path_scaled(
+        self, path: Path2d, sx: float, sy: float, tx: float = 0.0, ty: float = 0.0
+    ) -> None:
+        """Extend the path by another 2D path, which is scaled by `sx` and `sy` and
+        translated by `tx` and `ty`. Same result as
+        :code:`extend_multi_path(path.scale_translate(sx, sy, tx, ty))` but
+        without creating a temporary path. Ignores paths without any commands
+        (empty paths).
+
+        .. versionadded:: 1.1
+
+        """
+        if len(path) == 0:
+            return
+        vertices = [Vec2(v.x * sx + tx, v.y * sy + ty) for v in path._vertices]
+        self.move_to(vertices[0])
+        self._extend_commands(path)
+        self._vertices.extend(vertices[1:])
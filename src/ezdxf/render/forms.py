@@ -80,10 +80,10 @@ def circle(
     radius = float(radius)
     delta = math.tau / count
     alpha = 0.0
-    for index in range(count):
-        x = math.cos(alpha) * radius
-        y = math.sin(alpha) * radius
-        yield Vec3(x, y, elevation)
+    cos = math.cos
+    sin = math.sin
+    for _ in range(count):
+        yield Vec3(cos(alpha) * radius, sin(alpha) * radius, elevation)
         alpha += delta
 
     if close:
@@ -447,7 +447,7 @@ def turtle(commands: str, start=Vec2(0, 0), angle: float = 0) -> Iterator[Vec2]:
     square with a side length of 10 drawing units.
 
     Args:
-        commands: command string, commands are separated by spaces
+        commands: command string, commands are separated by one or more spaces
         start: starting point, default is (0, 0)
         angle: starting direction, default is 0 deg
 
@@ -455,19 +455,20 @@ def turtle(commands: str, start=Vec2(0, 0), angle: float = 0) -> Iterator[Vec2]:
 
     cursor = start
     yield cursor
-    for cmd in commands.split(" "):
-        cmd = cmd.strip()
-        if cmd[0] == "l":
+    # split() without arguments skips multiple or leading/trailing spaces
+    for cmd in commands.split():
+        code = cmd[0]
+        if code == "l":
             if len(cmd) == 1:
                 angle += 90
             else:
                 angle += float(cmd[1:])
-        elif cmd[0] == "r":
+        elif code == "r":
             if len(cmd) == 1:
                 angle -= 90
             else:
                 angle -= float(cmd[1:])
-        elif cmd[0] == "@":
+        elif code == "@":
             x, y = cmd[1:].split(",")
             cursor += Vec2(float(x), float(y))
             yield cursor
@@ -326,6 +326,16 @@ class HatchBaseLine:
         # denominator (_end - origin).magnitude is 1.0 !!!
         return (self.origin - point).det(self._end - point)
 
+    def signed_distances(self, points: Sequence[Vec2]) -> list[float]:
+        """Returns the signed normal distances of all given `points` from this
+        hatch baseline, same result as :meth:`signed_distance` for each point
+        but without the creation of temporary :class:`~ezdxf.math.Vec2`
+        instances.
+        """
+        ox, oy = self.origin.x, self.origin.y
+        ex, ey = self._end.x, self._end.y
+        return [(ox - p.x) * (ey - p.y) - (oy - p.y) * (ex - p.x) for p in points]
+
     def pattern_renderer(self, distance: float) -> PatternRenderer:
         """Returns the :class:`PatternRenderer` for the given signed `distance`."""
         return PatternRenderer(self.hatch_line(distance), self.line_pattern)
@@ -363,15 +373,33 @@ def intersect_polygon(
         if count < 3:
             return
 
+    # calculate the normal distances of all vertices in a single pass:
+    distances = baseline.signed_distances(polygon[:count])
+    # The hatch line numbers are calculated once for each vertex, an edge
+    # visits only the hatch lines in the range of the line numbers of its
+    # vertices, see also function hatch_line_distances():
+    normal_distance = baseline.normal_distance
+    line_numbers = [math.ceil(d / normal_distance) for d in distances]
+    # each hatch line is crossed by at least two edges, create it only once:
+    hatch_lines: dict[int, HatchLine] = dict()
     prev_point = polygon[count - 1]  # last point
-    dist_prev = baseline.signed_distance(prev_point)
+    dist_prev = distances[count - 1]
+    num_prev = line_numbers[count - 1]
     for index in range(count):
         point = polygon[index]
-        dist_point = baseline.signed_distance(point)
-        for hatch_line_distance in hatch_line_distances(
-            (dist_prev, dist_point), baseline.normal_distance
-        ):
-            hatch_line = baseline.hatch_line(hatch_line_distance)
+        dist_point = distances[index]
+        num_point = line_numbers[index]
+        if num_prev < num_point:
+            line_numbers_range = range(num_prev, num_point)
+        else:
+            line_numbers_range = range(num_point, num_prev)
+        for num in line_numbers_range:
+            try:
+                hatch_line = hatch_lines[num]
+            except KeyError:
+                hatch_line = baseline.hatch_line(normal_distance * num)
+                hatch_lines[num] = hatch_line
+            hatch_line_distance = hatch_line.distance
             ip = hatch_line.intersect_line(
                 prev_point,
                 point,
@@ -386,6 +414,7 @@ def intersect_polygon(
 
         prev_point = point
         dist_prev = dist_point
+        num_prev = num_point
 
 
 def hatch_polygons(
@@ -436,6 +465,10 @@ def intersect_path(
     line.
 
     """
+    normal_distance = baseline.normal_distance
+    # the hatch lines for line segments are created only once, see function
+    # intersect_polygon():
+    hatch_lines: dict[int, HatchLine] = dict()
     for path_element in _path_elements(path):
         if isinstance(path_element, Bezier4P):
             distances = [
@@ -451,10 +484,19 @@ def intersect_path(
             a, b = Vec2.generate(path_element)
             dist_a = baseline.signed_distance(a)
             dist_b = baseline.signed_distance(b)
-            for hatch_line_distance in hatch_line_distances(
-                (dist_a, dist_b), baseline.normal_distance
-            ):
-                hatch_line = baseline.hatch_line(hatch_line_distance)
+            # visit only the hatch lines crossed by the line segment, see
+            # function intersect_polygon():
+            num_a = math.ceil(dist_a / normal_distance)
+            num_b = math.ceil(dist_b / normal_distance)
+            if num_a > num_b:
+                num_a, num_b = num_b, num_a
+            for num in range(num_a, num_b):
+                try:
+                    hatch_line = hatch_lines[num]
+                except KeyError:
+                    hatch_line = baseline.hatch_line(normal_distance * num)
+                    hatch_lines[num] = hatch_line
+                hatch_line_distance = hatch_line.distance
                 ip = hatch_line.intersect_line(a, b, dist_a, dist_b)
                 if (
                     ip.type != IntersectionType.NONE
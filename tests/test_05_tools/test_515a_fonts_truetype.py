@@ -3,9 +3,11 @@
 
 import pytest
 import platform
+import shutil
+from pathlib import Path
 
 from ezdxf.math import BoundingBox2d
-from ezdxf.fonts import fonts
+from ezdxf.fonts import fonts, font_manager, ttfonts
 
 TEST_FONTS = [
     ("LiberationSans-Regular.ttf", "Liberation Sans"),
@@ -58,10 +60,35 @@ def test_get_font_face_with_definition():
     assert fonts.get_font_face("Arial.ttf") is fonts.find_font_face("arial.ttf")
 
 
+def test_kerning_table_without_subtable_of_requested_format():
+    class KernTable:
+        def getkern(self, fmt):
+            return None
+
+    kerning = ttfonts.KerningTable({"kern": KernTable()}, {65: "A", 86: "V"})
+    assert len(kerning) == 0
+    assert kerning.get("A", "V") == 0.0
+
+
+def test_get_global_font_manager():
+    assert fonts.get_font_manager() is fonts.font_manager
+
+
 def test_map_shx_to_ttf():
     assert fonts.map_shx_to_ttf("TXT") == "txt_____.ttf"
     assert fonts.map_shx_to_ttf("TXT.SHX") == "txt_____.ttf"
     assert fonts.map_shx_to_ttf("txt.shx") == "txt_____.ttf"
+    assert fonts.map_shx_to_ttf("Arial.ttf") == "Arial.ttf"
+
+
+@pytest.mark.parametrize("name", ["TXT", "txt.shx", "TXT.SHX", "isocp.Shx"])
+def test_is_shx_font_name(name):
+    assert fonts.is_shx_font_name(name) is True
+
+
+@pytest.mark.parametrize("name", ["Arial.ttf", "txt.shp", "isocp.ttf"])
+def test_is_not_shx_font_name(name):
+    assert fonts.is_shx_font_name(name) is False
 
 
 def test_map_ttf_to_shx():
@@ -78,6 +105,14 @@ def test_get_font_measurement_for_shx_fonts():
     assert len(fonts.get_font_measurements("TXT.shx")) == 4
 
 
+def test_true_type_fonts_share_the_render_engine():
+    font1 = fonts.TrueTypeFont("DejaVuSans.ttf", cap_height=1)
+    font2 = fonts.TrueTypeFont("dejavusans.TTF", cap_height=2)
+    font3 = fonts.TrueTypeFont("/any/folder/DejaVuSans.ttf", cap_height=3)
+    assert font1.engine is font2.engine
+    assert font1.engine is font3.engine
+
+
 class TestFontFace:
     def test_same_font_faces_have_equal_hash_values(self):
         f1 = fonts.FontFace("arial.ttf", "Arial")
@@ -222,6 +257,22 @@ class TestTrueTypeFont:
         assert box.size.x > 19
         assert box.size.y > 3
 
+    def test_undefined_chars_share_the_glyph_path(self, ttf):
+        engine = ttf.engine
+        # DejaVuSans.ttf does not include CJK glyphs
+        assert engine.get_glyph_path("\u4e00") is engine.get_glyph_path("\u4e01")
+        assert engine.get_glyph_path("A") is not engine.get_glyph_path("B")
+
+    def test_glyph_caches_evict_least_recently_used_glyphs(self, ttf, monkeypatch):
+        monkeypatch.setattr(ttfonts, "GLYPH_CACHE_SIZE", 4)
+        engine = ttf.engine
+        for char in "abcdefgh":
+            engine.get_glyph_path(char)
+        engine.get_glyph_path("e")
+        assert list(engine._glyph_path_cache) == list("fghe")
+        assert len(engine._generic_glyph_cache) == 4
+        assert len(engine._glyph_name_path_cache) == 4
+
 
 # This test works when testing only this test script in PyCharm or with pytest, but does
 # not work when launching the whole test suite.
@@ -249,5 +300,95 @@ def test_find_generic_font_family():
     assert fonts.find_best_match(family="monospace").filename == "DejaVuSansMono.ttf"
 
 
+class TestRebuildFontManager:
+    @pytest.fixture
+    def font_folder(self, tmp_path):
+        repo_fonts = Path(__file__).parent.parent.parent / "fonts"
+        src = next(repo_fonts.rglob("LiberationMono-Regular.ttf"))
+        shutil.copy(src, tmp_path)
+        return tmp_path
+
+    @pytest.fixture
+    def scan_counter(self, monkeypatch):
+        files = []
+        get_ttf_font_face = font_manager.get_ttf_font_face
+
+        def counter(font_path):
+            files.append(font_path)
+            return get_ttf_font_face(font_path)
+
+        monkeypatch.setattr(font_manager, "get_ttf_font_face", counter)
+        return files
+
+    def test_rebuild_reuses_unchanged_fonts(self, font_folder, scan_counter):
+        fm = font_manager.FontManager()
+        fm.scan_all([str(font_folder)])
+        assert len(scan_counter) == 1
+
+        fm2 = font_manager.FontManager()
+        fm2.loads(fm.dumps())
+        fm2.scan_all([str(font_folder)])
+        assert len(scan_counter) == 1, "expected no parsing of unchanged font files"
+        assert fm2.get_font_face("LiberationMono-Regular.ttf").family == (
+            "Liberation Mono"
+        )
+
+    def test_rebuild_parses_modified_fonts(self, font_folder, scan_counter):
+        fm = font_manager.FontManager()
+        fm.scan_all([str(font_folder)])
+        font_file = font_folder / "LiberationMono-Regular.ttf"
+        with open(font_file, "ab") as fp:
+            fp.write(b"\0" * 4)
+        fm.scan_all([str(font_folder)])
+        assert len(scan_counter) == 2
+
+    def test_build_font_manager_cache_reuses_existing_cache(
+        self, font_folder, scan_counter, tmp_path_factory, monkeypatch
+    ):
+        cache_file = tmp_path_factory.mktemp("cache") / "font_manager_cache.json"
+        fm = font_manager.FontManager()
+        fm.scan_all([str(font_folder)])
+        cache_file.write_text(fm.dumps())
+        assert len(scan_counter) == 1
+
+        new_fm = font_manager.FontManager()
+        monkeypatch.setattr(fonts, "_font_manager", new_fm)
+        monkeypatch.setattr(fonts, "_font_manager_loaded", False)
+        monkeypatch.setattr(
+            new_fm, "build", lambda: new_fm.scan_all([str(font_folder)])
+        )
+        fonts.build_font_manager_cache(cache_file)
+        assert len(scan_counter) == 1, "expected no parsing of unchanged font files"
+        assert new_fm.has_font("LiberationMono-Regular.ttf")
+
+    def test_scan_folder_with_broken_symlink(self, font_folder):
+        broken_link = font_folder / "broken.ttf"
+        try:
+            broken_link.symlink_to(font_folder / "does_not_exist.ttf")
+        except OSError:
+            pytest.skip("symlinks not supported")
+        fm = font_manager.FontManager()
+        fm.scan_all([str(font_folder)])
+        assert fm.get_font_face("LiberationMono-Regular.ttf").family == (
+            "Liberation Mono"
+        )
+        assert fm.has_font("broken.ttf")
+
+
+def test_fallback_font_is_updated_by_scanning_fonts(tmp_path):
+    repo_fonts = Path(__file__).parent.parent.parent / "fonts"
+    fm = font_manager.FontManager()
+    shutil.copy(next(repo_fonts.rglob("LiberationMono-Regular.ttf")), tmp_path)
+    fm.scan_all([str(tmp_path)])
+    assert fm.fallback_font_name() == "Arial.ttf", "expected the default font"
+    with pytest.raises(KeyError):
+        fm.get_font_face("mozman.ttf")
+
+    shutil.copy(next(repo_fonts.rglob("DejaVuSans.ttf")), tmp_path)
+    fm.scan_all([str(tmp_path)])
+    assert fm.fallback_font_name() == "DejaVuSans.ttf"
+    assert fm.get_font_face("mozman.ttf").family == "DejaVu Sans"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -425,6 +425,12 @@ def test_turtle_move_relative():
     assert vertices[-1].isclose((10, 10))
 
 
+def test_turtle_ignores_multiple_spaces():
+    vertices = list(forms.turtle(" 10  l 10 l  10 "))
+    assert len(vertices) == 4
+    assert vertices[-1].isclose((0, 10))
+
+
 class TestCylinder2p:
     def test_default_arguments(self):
         cylinder = forms.cylinder_2p(16)
@@ -5,6 +5,7 @@ import math
 
 from ezdxf.path import (
     Path,
+    Path2d,
     make_path,
     converter,
     Command,
@@ -694,6 +695,31 @@ def test_transform(p1):
     assert p2.end.isclose((7, 1))
 
 
+def test_scale_translate_2d_path():
+    p = Path2d((1, 1))
+    p.line_to((2, 1))
+    p.curve3_to((3, 1), (2, 2))
+    m = Matrix44.scale(2, 3, 1) @ Matrix44.translate(4, 5, 0)
+    p2 = p.scale_translate(2, 3, 4, 5)
+    assert p2.command_codes() == p.command_codes()
+    assert close_vectors(p2.control_vertices(), p.transform(m).control_vertices())
+
+
+def test_extend_multi_path_scaled():
+    p = Path2d((1, 1))
+    p.line_to((2, 1))
+    p.move_to((3, 1))
+    p.curve4_to((4, 1), (3, 2), (4, 2))
+    expected = Path2d((7, 7))
+    expected.line_to((8, 7))
+    path = expected.clone()
+    expected.extend_multi_path(p.scale_translate(2, 3, 4, 5))
+    path.extend_multi_path_scaled(p, 2, 3, 4, 5)
+    assert path.has_sub_paths is True
+    assert path.command_codes() == expected.command_codes()
+    assert path.control_vertices() == expected.control_vertices()
+
+
 def test_control_vertices(p1):
     vertices = list(p1.control_vertices())
     assert close_vectors(
@@ -1065,6 +1091,38 @@ def test_extend_path_by_another_multi_path():
     assert path.end == (5, 0, 0)
 
 
+def test_extend_path_preserves_path_elements():
+    path = Path((1, 0, 0))
+    path.curve3_to((3, 0, 0), (2, 1, 0))
+    p1 = Path((4, 0, 0))
+    p1.curve4_to((7, 0, 0), (5, 1, 0), (6, 1, 0))
+    p1.move_to((8, 0, 0))
+    p1.line_to((9, 0, 0))
+    path.extend_multi_path(p1)
+    assert path.command_codes() == [
+        Command.CURVE3_TO,
+        Command.MOVE_TO,
+        Command.CURVE4_TO,
+        Command.MOVE_TO,
+        Command.LINE_TO,
+    ]
+    assert path.control_vertices() == Vec3.list(
+        [(1, 0), (2, 1), (3, 0), (4, 0), (5, 1), (6, 1), (7, 0), (8, 0), (9, 0)]
+    )
+
+
+def test_extend_empty_path_by_a_multi_path():
+    path = Path2d()
+    p1 = Path2d((3, 0))
+    p1.line_to((4, 0))
+    p1.move_to((5, 0))
+    p1.line_to((6, 0))
+    path.extend_multi_path(p1)
+    assert path.has_sub_paths is True
+    assert path.command_codes() == p1.command_codes()
+    assert path.control_vertices() == p1.control_vertices()
+
+
 def test_append_empty_path():
     path = Path((1, 0, 0))
     path.line_to((2, 0, 0))
@@ -45,6 +45,15 @@ class TestHatchBaseLine:
                 Vec2(), direction=Vec2(1, 0), offset=Vec2(0, 1e-6)
             )
 
+    def test_signed_distances_of_multiple_points(self):
+        line = hatching.HatchBaseLine(
+            origin=Vec2((1, 2)), direction=Vec2(1, 1), offset=Vec2(-1, 1)
+        )
+        points = Vec2.list([(0, 0), (3, -1), (-2, 5), (1, 2)])
+        assert line.signed_distances(points) == [
+            line.signed_distance(p) for p in points
+        ]
+
 
 class TestIntersectHatchLine:
     @pytest.fixture
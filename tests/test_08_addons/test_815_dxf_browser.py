@@ -14,6 +14,7 @@ from ezdxf.addons.browser import DXFTagsModel, DXFStructureModel, DXFDocument
 from ezdxf.addons.browser.tags import compile_tags
 from ezdxf.addons.browser.data import (
     EntityIndex,
+    get_row_from_line_number,
     EntityHistory,
     SearchIndex,
 )
@@ -57,6 +58,13 @@ class TestDXFTagsModel:
     def test_row_count(self, model):
         assert model.rowCount() == len(compile_tags(self.tags()))
 
+    def test_row_from_line_number(self, model):
+        tags = model.compiled_tags()
+        for line_number in range(-1, 25):
+            assert model.row_from_line_number(
+                line_number
+            ) == get_row_from_line_number(tags, 1, line_number)
+
     def test_render_display_role(self, model):
         assert model.data(ModelIndex(0, 0), role=Qt.DisplayRole) == "0"
         assert model.data(ModelIndex(0, 1), role=Qt.DisplayRole) == "<ctrl>"
@@ -103,6 +111,17 @@ class TestDXFDocument:
         sections = load_dxf_structure(txt2tags(ENTITIES))
         return DXFDocument(sections)
 
+    def test_empty_document_has_no_entity_index(self):
+        doc = DXFDocument()
+        assert doc.entity_index is None
+        assert doc.max_line_number == 1
+
+    def test_entity_index_is_built_on_first_access(self, doc):
+        assert doc._entity_index is None
+        index = doc.entity_index
+        assert index is not None
+        assert doc.entity_index is index, "expected the same index"
+
     def test_get_entity_returns_entity_tags(self, doc):
         entity = doc.get_entity("100")
         assert entity[0] == (0, "LINE")
@@ -291,12 +310,29 @@ class TestEntityIndex:
         assert index.get_entity_at_line(9) is e3
         assert index.get_entity_at_line(10) is e3
 
+    def test_entity_at_line_before_first_entity(self, index):
+        assert index.get_entity_at_line(0) is None
+
     def test_entity_at_line_for_dummy_handle(self, index):
         e = index.get("*1")
         assert index.get_entity_at_line(19) is e
         assert index.get_entity_at_line(20) is e
 
 
+def test_get_handle_of_entity_with_lowercase_handle():
+    index = EntityIndex(
+        {
+            "ENTITIES": [
+                Tags([DXFTag(0, "ENTITY1"), DXFTag(5, "f001")]),
+                Tags([DXFTag(0, "ENTITY2"), DXFTag(5, "F002")]),
+            ]
+        }
+    )
+    e1 = index.get("F001")
+    assert index.get_handle(e1) == "F001", "expected the indexed handle"
+    assert index.next_entity(e1) is index.get("F002")
+
+
 def test_entity_index_adds_missing_endsec_tag():
     # The function load_dxf_structure() throws the ENDSEC tag away.
     # The entity indexer must take this issue into account!
@@ -338,6 +374,16 @@ class TestEntityHistory:
         assert len(history) == 2
         assert history.index == 1
 
+    def test_history_has_a_max_length(self):
+        history = EntityHistory(max_length=3)
+        entities = [Tags([DXFTag(1, str(i))]) for i in range(5)]
+        for entity in entities:
+            history.append(entity)
+        assert len(history) == 3
+        assert history.index == 2
+        assert history.content() == entities[2:]
+        assert history.back() is entities[3]
+
     def test_go_back_in_history(self, history2):
         first, second = history2.content()
         assert history2.index == 1
@@ -386,6 +432,13 @@ LayerName2
 """
 
 
+SEARCH_EXAMPLE3 = """0
+SEARCH3
+8
+LayerName3
+"""
+
+
 class TestSearchIndex:
     @pytest.fixture(scope="class")
     def entities(self):
@@ -535,6 +588,56 @@ class TestSearchIndex:
         assert entity is search.entities[1]
         assert index == 2
 
+    def test_set_current_entity(self, search):
+        search.set_current_entity(search.entities[1], 2)
+        assert search.cursor() == (1, 2)
+
+    def test_set_current_entity_by_a_copy_of_the_entity_tags(self, search):
+        search.set_current_entity(Tags(search.entities[1]), 2)
+        assert search.cursor() == (1, 2)
+
+    def test_set_current_entity_by_equal_entity_tags(self, search):
+        search.set_current_entity(txt2tags(SEARCH_EXAMPLE2), 1)
+        assert search.cursor() == (1, 1)
+
+    def test_set_current_entity_of_unknown_entity_resets_cursor(self, search):
+        search.set_current_entity(search.entities[1], 2)
+        search.set_current_entity(txt2tags(SEARCH_EXAMPLE3), 1)
+        assert search.cursor() == (0, 0)
+
+    def test_whole_words_search(self, search):
+        search.whole_words = True
+        assert search.find("Layer") is search.NOT_FOUND
+        entity, index = search.find("layername2")
+        assert entity is search.entities[1]
+        assert index == 1
+
+    def test_regex_search(self, search):
+        search.regex = True
+        entity, index = search.find("name[2-9]$")
+        assert entity is search.entities[1]
+        assert index == 1
+
+    def test_case_sensitive_regex_search(self, search):
+        search.regex = True
+        search.case_insensitive = False
+        assert search.find("layername") is search.NOT_FOUND
+
+    def test_regex_options_changed_after_setting_the_search_term(self, search):
+        search.regex = True
+        search.reset_search_term("layername")
+        search.case_insensitive = False  # as in FindDialog.update_options()
+        search.reset_cursor()
+        assert search.find_forward() is search.NOT_FOUND
+        search.case_insensitive = True
+        search.reset_cursor()
+        entity, index = search.find_forward()
+        assert entity is search.entities[0]
+
+    def test_invalid_regex_finds_nothing(self, search):
+        search.regex = True
+        assert search.find("name[") is search.NOT_FOUND
+
     def test_failing_find_forward_stops_at_the_end(self, search):
         assert search.find("XXX") is search.NOT_FOUND
         assert search.is_end_of_index is True
@@ -57,6 +57,25 @@ class TestFloatDNAZeroOne:
         assert dna[-3:] == pytest.approx([0.1, 0.2, 0.3])
         assert sum(dna) == pytest.approx(0.6)
 
+    def test_slice_is_a_copy(self):
+        dna = ga.FloatDNA([0.0] * 5)
+        part = dna[1:3]
+        part[0] = 1.0
+        assert dna[1] == 0.0
+
+    def test_copy_from_dna_of_different_length(self):
+        dna = ga.FloatDNA([0.0] * 5)
+        dna.copy_from(ga.FloatDNA([0.5] * 7))
+        assert len(dna) == 7
+        assert dna[6] == 0.5
+
+    def test_copy_and_compare(self):
+        dna = ga.FloatDNA.random(10)
+        copy = dna.copy()
+        assert dna == copy
+        copy.flip_mutate_at(0)
+        assert dna != copy
+
 
 class TestBitDNA:
     def test_init_value(self):
@@ -74,6 +93,10 @@ class TestBitDNA:
         assert len(dna) == 20
         assert len(set(dna)) == 2
 
+    @pytest.mark.parametrize("length", [0, 1, 7, 64])
+    def test_random_dna_length(self, length):
+        assert len(ga.BitDNA.random(length)) == length
+
     def test_subscription_setter(self):
         dna = ga.BitDNA([1] * 20)
         dna[-3:] = [False, False, False]
@@ -146,6 +169,18 @@ class TestUniqueIntDNA:
         assert copy1 == dna1
         assert copy2 == dna2
 
+    def test_replace_dna_ocx1_preserves_length_of_duplicate_values(self):
+        dna1 = ga.IntegerDNA([2, 2, 2, 2], 4)
+        dna2 = ga.IntegerDNA([0, 2, 3, 0], 4)
+        ga.replace_dna_ocx1(dna1, dna2, 1, 3)
+        assert list(dna1) == [2, 2, 3, 2]
+
+    def test_replace_float_dna_ocx1(self):
+        dna1 = ga.FloatDNA([0.5, 0.5, 0.25, 0.5])
+        dna2 = ga.FloatDNA([0.0, 0.5, 0.75, 0.0])
+        ga.replace_dna_ocx1(dna1, dna2, 1, 3)
+        assert list(dna1) == [0.25, 0.5, 0.75, 0.5]
+
 
 class TestIntegerDNA:
     def test_init_value(self):
@@ -176,6 +211,27 @@ class TestIntegerDNA:
         assert len(dna) == 10
         assert dna.is_valid is True
 
+    def test_copy_from(self):
+        dna = ga.IntegerDNA([0, 1, 2], 3)
+        other = ga.IntegerDNA([4, 3, 2, 1, 0], 5)
+        other.fitness = 0.5
+        dna.copy_from(other)
+        assert dna == other
+        assert dna.fitness == 0.5
+        dna.flip_mutate_at(0)
+        assert dna[0] == 0, "expected the max value of other"
+        assert other[0] == 4, "expected an independent copy"
+
+    def test_copy(self):
+        dna = ga.IntegerDNA([0, 1, 2, 3, 4], 5)
+        dna.fitness = 0.5
+        copy = dna.copy()
+        assert copy == dna
+        assert copy.fitness == 0.5
+        copy.flip_mutate_at(0)
+        assert copy[0] == 4, "expected the same max value"
+        assert dna[0] == 0, "expected an independent copy"
+
 
 class TestHallOfFame:
     @pytest.fixture
@@ -219,6 +275,20 @@ class TestHallOfFame:
         assert len(hof._unique_entries) == 3
 
 
+@pytest.mark.parametrize(
+    "rate, expected", [(0.0, []), (1.0, [0, 1, 2, 3, 4])]
+)
+def test_mutation_indices(rate, expected):
+    assert ga.mutation_indices(5, rate) == expected
+
+
+def test_random_swap_mutate_preserves_values():
+    dna = ga.UniqueIntDNA(10)
+    mutate = ga.RandomSwapMutate()
+    mutate.mutate(dna, 1.0)
+    assert len(set(dna)) == 10
+
+
 def test_reverse_mutate():
     dna = ga.UniqueIntDNA(10)
     mutate = ga.ReverseMutate(3)
@@ -290,6 +360,63 @@ def test_two_point_crossover():
     assert list(dna2[11:]) == [True] * 9
 
 
+def test_two_point_crossover_float_dna():
+    dna1 = ga.FloatDNA([0.0] * 10)
+    dna2 = ga.FloatDNA([1.0] * 10)
+    dna1.fitness = 0.5
+    ga.recombine_dna_2pcx(dna1, dna2, 3, 5)
+    assert list(dna1) == [0, 0, 0, 1, 1, 0, 0, 0, 0, 0]
+    assert list(dna2) == [1, 1, 1, 0, 0, 1, 1, 1, 1, 1]
+    assert dna1.fitness is None
+
+
+@pytest.mark.parametrize("dna_type", [ga.BitDNA, ga.FloatDNA])
+def test_flip_mutation_taints_fitness(dna_type):
+    dna = dna_type([0] * 4)
+    dna.fitness = 0.5
+    dna.flip_mutate_at(0)
+    assert dna.fitness is None
+
+    dna.fitness = 0.5
+    dna.flip_mutate([])
+    assert dna.fitness == 0.5, "expected no change"
+    dna.flip_mutate([1, 2])
+    assert dna.fitness is None
+
+
+@pytest.mark.parametrize("dna_type", [ga.BitDNA, ga.FloatDNA])
+def test_swap_dna_genes(dna_type):
+    dna1 = dna_type([0] * 6)
+    dna2 = dna_type([1] * 6)
+    dna1.fitness = 0.5
+    ga.swap_dna_genes(dna1, dna2, [1, 4])
+    assert list(dna1) == [0, 1, 0, 0, 1, 0]
+    assert list(dna2) == [1, 0, 1, 1, 0, 1]
+    assert dna1.fitness is None
+
+
+def test_float_dna_flip_mutate_at_multiple_indices():
+    dna = ga.FloatDNA([0, 0.1, 0.2, 0.3, 0.4])
+    dna.flip_mutate([0, 2, 4])
+    assert list(dna) == pytest.approx([1.0, 0.1, 0.8, 0.3, 0.6])
+
+
+class TaggedBitDNA(ga.BitDNA):
+    """Custom DNA class with an additional attribute."""
+
+    def __init__(self, values, tag: str):
+        super().__init__(values)
+        self.tag = tag
+
+
+def test_copy_of_custom_dna_class_preserves_attributes():
+    dna = TaggedBitDNA([1, 0, 1], "tag")
+    copy = dna.copy()
+    assert type(copy) is TaggedBitDNA
+    assert copy.tag == "tag"
+    assert list(copy) == [True, False, True]
+
+
 class TestThresholdFilter:
     @pytest.fixture
     def candidates(self):
@@ -391,6 +518,107 @@ class TestGeneticOptimizer:
         best_packer = evaluator.run_packer(optimizer.best_dna)
         assert len(best_packer.bins[0].items) > 1
 
+    def test_custom_map_function(self, packer):
+        calls = []
+
+        def recording_map(func, dna_strands):
+            calls.append(len(dna_strands))
+            return map(func, dna_strands)
+
+        evaluator = DummyEvaluator(packer)
+        optimizer = ga.GeneticOptimizer(evaluator, 3)
+        optimizer.map = recording_map
+        optimizer.add_candidates(ga.BitDNA.n_random(10, len(packer.items)))
+        optimizer.execute()
+        assert len(calls) == 3
+        assert calls[0] == 10, "expected all DNA strands of first generation"
+        assert optimizer.best_fitness == 0.5
+
+    def test_evaluates_only_changed_offspring(self, packer):
+        evaluated = []
+
+        def recording_map(func, dna_strands):
+            evaluated.extend(dna_strands)
+            return map(func, dna_strands)
+
+        evaluator = DummyEvaluator(packer)
+        optimizer = ga.GeneticOptimizer(evaluator, 2)
+        optimizer.map = recording_map
+        optimizer.crossover_rate = 0.0
+        optimizer.mutation_rate = 0.0
+        optimizer.add_candidates(ga.BitDNA.n_random(10, len(packer.items)))
+        optimizer.execute()
+        assert len(evaluated) == 10, "expected only the initial candidates"
+
+    def test_recycling_dna_preserves_best_dna(self):
+        class BitCounter(ga.Evaluator):
+            def evaluate(self, dna: ga.DNA) -> float:
+                return sum(dna) / len(dna)
+
+        evaluator = BitCounter()
+        optimizer = ga.GeneticOptimizer(evaluator, 50, max_fitness=2.0)
+        optimizer.add_candidates(ga.BitDNA.n_random(20, 30))
+        optimizer.execute()
+        assert len(optimizer._dna_pool) > 0
+        assert evaluator.evaluate(optimizer.best_dna) == optimizer.best_fitness
+        for dna in optimizer.hall_of_fame:
+            assert evaluator.evaluate(dna) == dna.fitness
+
+    def test_custom_dna_class_is_not_recycled(self):
+        class BitCounter(ga.Evaluator):
+            def evaluate(self, dna: ga.DNA) -> float:
+                assert dna.tag == "tag", "expected preserved attribute"
+                return sum(dna) / len(dna)
+
+        optimizer = ga.GeneticOptimizer(BitCounter(), 10, max_fitness=2.0)
+        optimizer.add_candidates(
+            TaggedBitDNA(ga.BitDNA.random(30), "tag") for _ in range(20)
+        )
+        optimizer.execute()
+        assert len(optimizer._dna_pool) == 0
+        assert all(dna.tag == "tag" for dna in optimizer.candidates)
+
+    def test_custom_dna_class_with_copy_from_is_recycled(self):
+        class CopyableTaggedBitDNA(TaggedBitDNA):
+            def copy_from(self, other: ga.DNA) -> None:
+                super().copy_from(other)
+                self.tag = other.tag
+
+        class BitCounter(ga.Evaluator):
+            def evaluate(self, dna: ga.DNA) -> float:
+                return sum(dna) / len(dna)
+
+        optimizer = ga.GeneticOptimizer(BitCounter(), 10, max_fitness=2.0)
+        optimizer.add_candidates(
+            CopyableTaggedBitDNA(ga.BitDNA.random(30), "tag") for _ in range(20)
+        )
+        optimizer.execute()
+        assert len(optimizer._dna_pool) > 0
+
+
+    @pytest.mark.parametrize(
+        "dna_factory",
+        [
+            lambda: ga.BitDNA.n_random(20, 30),
+            lambda: ga.FloatDNA.n_random(20, 30),
+            lambda: ga.IntegerDNA.n_random(20, 30, 5),
+            lambda: ga.UniqueIntDNA.n_random(20, 30),
+        ],
+    )
+    def test_random_seed_reproduces_execution(self, dna_factory):
+        class Summation(ga.Evaluator):
+            def evaluate(self, dna: ga.DNA) -> float:
+                return float(sum(dna))
+
+        def run() -> list:
+            random.seed(42)
+            optimizer = ga.GeneticOptimizer(Summation(), 20)
+            optimizer.add_candidates(dna_factory())
+            optimizer.execute()
+            return list(optimizer.best_dna)
+
+        assert run() == run()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])